@@ -4,27 +4,107 @@
 import argparse
 import sys
 import os
-from typing import Optional, List, Dict, Any
-import pandas as pd
-import pandapower as pp
-from tabulate import tabulate
+from typing import Optional, List, Dict, Any, Tuple
 
-from database import GridDatabase
-from examples import create_example_grid, create_ieee_9_bus, create_ieee_39_bus, create_ieee_39_bus_standard
-from contingency import ContingencyAnalysis
-from convergence_diagnostic import ConvergenceDiagnostic
+# Heavyweight imports (pandapower/pandas/numpy and the analysis modules)
+# are deferred into the functions that first need them so that --help and
+# --list-grids don't pay the full scipy/numba import graph at startup.
+
+
+def _lightsim2grid_available() -> bool:
+    """Check for lightsim2grid's compiled Newton-Raphson backend."""
+    try:
+        import lightsim2grid  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+# Row formatter for the critical-contingencies table, compiled once at import
+# so the per-row loop runs straight-line format ops instead of re-parsing
+# format specs on every call
+_critical_row_fmt = eval(
+    "lambda c: ["
+    "c['contingency_type'].replace(' Outage', ''), "
+    "c['element_name'][:20], "
+    "c['severity'], "
+    "'%.3f' % c.get('max_voltage_pu', 0), "
+    "'%.3f' % c.get('min_voltage_pu', 0), "
+    "'%.1f' % max(c.get('max_line_loading', 0), c.get('max_trafo_loading', 0))]"
+)
+
+
+def _partition_violations(violations: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Split violations into voltage and overload groups in a single pass."""
+    voltage_violations = []
+    current_violations = []
+    for v in violations:
+        if 'Voltage' in v['violation_type']:
+            voltage_violations.append(v)
+        else:
+            current_violations.append(v)
+    return voltage_violations, current_violations
+
+
+def _render_table(table_data, headers) -> str:
+    """Render a result table, picking the faster formatter for large tables.
+
+    tabulate's grid format is pure Python and gets slow beyond a few hundred
+    rows; pandas' to_string uses its C-accelerated column formatter.
+    """
+    import pandas as pd
+    from tabulate import tabulate
+
+    if len(table_data) > 200:
+        return pd.DataFrame(table_data, columns=headers).to_string(index=False)
+    return tabulate(table_data, headers=headers, tablefmt="grid")
 
 
 class TerminalLoadFlow:
     """Terminal-based load flow calculator."""
     
     def __init__(self):
+        from database import GridDatabase
+
         self.db = GridDatabase()
         self.current_net = None
         self.current_grid_name = None
-        
+        self._grids_cache = None
+        self._contingency_cache = None
+
+    def _get_contingency(self):
+        """Return a ContingencyAnalysis for the current net.
+
+        The instance (and its deepcopied base net) is reused across
+        base-case and N-1 runs as long as the net object and its element
+        counts are unchanged.
+        """
+        from contingency import ContingencyAnalysis
+
+        token = (id(self.current_net), len(self.current_net.line),
+                 len(self.current_net.trafo), len(self.current_net.gen))
+        if self._contingency_cache is None or self._contingency_cache[0] != token:
+            self._contingency_cache = (token, ContingencyAnalysis(self.current_net))
+        return self._contingency_cache[1]
+
+    def _grids_snapshot(self):
+        """Return (grids, name->id map), re-querying only when the db file changes."""
+        try:
+            mtime = os.path.getmtime(self.db.path)
+        except OSError:
+            mtime = None
+
+        if self._grids_cache is None or self._grids_cache[0] != mtime:
+            grids = self.db.get_all_grids()
+            name_to_id = {name.lower(): gid for gid, name, desc, created, modified, is_example in grids}
+            self._grids_cache = (mtime, grids, name_to_id)
+
+        return self._grids_cache[1], self._grids_cache[2]
+
     def load_example_grid(self, grid_type: str) -> bool:
         """Load an example grid."""
+        from examples import create_example_grid, create_ieee_9_bus, create_ieee_39_bus, create_ieee_39_bus_standard
+
         try:
             if grid_type.lower() == "simple":
                 self.current_net = create_example_grid()
@@ -53,14 +133,9 @@ class TerminalLoadFlow:
     def load_database_grid(self, grid_name: str) -> bool:
         """Load a grid from the database by name."""
         try:
-            grids = self.db.get_all_grids()
-            grid_id = None
-            
-            for gid, name, desc, created, modified, is_example in grids:
-                if name.lower() == grid_name.lower():
-                    grid_id = gid
-                    break
-            
+            grids, name_to_id = self._grids_snapshot()
+            grid_id = name_to_id.get(grid_name.lower())
+
             if grid_id is None:
                 print(f"Error: Grid '{grid_name}' not found in database")
                 self.list_available_grids()
@@ -82,29 +157,25 @@ class TerminalLoadFlow:
     def list_available_grids(self):
         """List all available grids in the database."""
         try:
-            grids = self.db.get_all_grids()
+            grids, _ = self._grids_snapshot()
             if not grids:
                 print("No grids found in database")
                 return
                 
+            import pandas as pd
+
             print("\nAvailable grids in database:")
             headers = ["ID", "Name", "Type", "Created", "Modified"]
-            table_data = []
-            
-            for grid_id, name, desc, created, modified, is_example in grids:
-                grid_type = "Example" if is_example else "User"
-                # Format dates
-                try:
-                    from datetime import datetime
-                    created_date = datetime.fromisoformat(created).strftime("%Y-%m-%d")
-                    modified_date = datetime.fromisoformat(modified).strftime("%Y-%m-%d")
-                except:
-                    created_date = created[:10] if len(created) > 10 else created
-                    modified_date = modified[:10] if len(modified) > 10 else modified
-                
-                table_data.append([grid_id, name, grid_type, created_date, modified_date])
-            
-            print(tabulate(table_data, headers=headers, tablefmt="grid"))
+
+            # Format all dates in one vectorized pass instead of per-row
+            # fromisoformat/strftime calls
+            df = pd.DataFrame(grids, columns=["id", "name", "desc", "created", "modified", "is_example"])
+            grid_types = df["is_example"].map({1: "Example", 0: "User", True: "Example", False: "User"})
+            created = pd.to_datetime(df["created"], errors="coerce").dt.strftime("%Y-%m-%d").fillna(df["created"].str[:10])
+            modified = pd.to_datetime(df["modified"], errors="coerce").dt.strftime("%Y-%m-%d").fillna(df["modified"].str[:10])
+
+            table_data = list(zip(df["id"], df["name"], grid_types, created, modified))
+            print(_render_table(table_data, headers))
             
         except Exception as e:
             print(f"Error listing grids: {e}")
@@ -114,40 +185,47 @@ class TerminalLoadFlow:
         if self.current_net is None:
             print("Error: No grid loaded. Use --grid or --load-db to load a grid first.")
             return False
-        
+
+        import pandapower as pp
+
         try:
             # Ensure there's a slack bus
             has_slack = False
-            if hasattr(self.current_net, 'ext_grid') and not self.current_net.ext_grid.empty:
+            if hasattr(self.current_net, 'ext_grid') and len(self.current_net.ext_grid) > 0:
                 has_slack = True
-            elif hasattr(self.current_net, 'gen') and not self.current_net.gen.empty:
-                has_slack = any(self.current_net.gen['slack'])
+            elif hasattr(self.current_net, 'gen') and len(self.current_net.gen) > 0:
+                has_slack = bool(self.current_net.gen['slack'].to_numpy(dtype=bool, copy=False).any())
             
             if not has_slack:
                 # Add external grid to first bus as slack
                 pp.create_ext_grid(self.current_net, bus=self.current_net.bus.index[0], vm_pu=1.0, name="Auto Slack")
                 print(f"ℹ Added automatic external grid to bus {self.current_net.bus.index[0]} for slack reference")
             
-            # Run power flow with enhanced settings for better convergence
-            try:
-                pp.runpp(self.current_net, verbose=False)
-                print("✓ Power flow calculation completed successfully")
-                return True
-            except pp.LoadflowNotConverged:
-                # Try with more iterations and relaxed tolerance
+            # Run power flow with enhanced settings for better convergence.
+            # Fallback attempts share one options dict and layer their deltas
+            # on top, so the retry cascade is driven by data rather than three
+            # hand-written runpp calls. A failed NR attempt leaves res_bus as
+            # NaN, so retries seed the solver from a DC solution (init='dc')
+            # instead of another flat start.
+            base_options = {'verbose': False}
+            attempts = [
+                ({'lightsim2grid': _lightsim2grid_available()},
+                 "✓ Power flow calculation completed successfully"),
+                ({'max_iteration': 100, 'tolerance_mva': 1e-3, 'init': 'dc'},
+                 "✓ Power flow calculation completed successfully (with enhanced solver settings)"),
+                ({'max_iteration': 100, 'tolerance_mva': 1e-2, 'init': 'dc'},
+                 "✓ Power flow calculation completed successfully (with relaxed tolerance)"),
+            ]
+            for overrides, message in attempts:
                 try:
-                    pp.runpp(self.current_net, max_iteration=100, tolerance_mva=1e-3, verbose=False)
-                    print("✓ Power flow calculation completed successfully (with enhanced solver settings)")
+                    pp.runpp(self.current_net, **base_options, **overrides)
+                    print(message)
                     return True
                 except pp.LoadflowNotConverged:
-                    # Try with even more relaxed settings
-                    try:
-                        pp.runpp(self.current_net, max_iteration=100, tolerance_mva=1e-2, verbose=False)
-                        print("✓ Power flow calculation completed successfully (with relaxed tolerance)")
-                        return True
-                    except:
-                        raise pp.LoadflowNotConverged("Failed with all solver configurations")
-            
+                    continue
+            raise pp.LoadflowNotConverged("Failed with all solver configurations")
+
+
         except pp.LoadflowNotConverged:
             print("✗ Power flow did not converge")
             print("  Check network connectivity and generation/load balance")
@@ -214,177 +292,158 @@ class TerminalLoadFlow:
     
     def _display_bus_results(self, detailed: bool):
         """Display bus voltage results."""
+        import numpy as np
+
         net = self.current_net
         
         print(f"\nBUS VOLTAGE RESULTS:")
         
         if detailed:
-            # Detailed table with all buses
+            # Detailed table with all buses, built via one vectorized join
+            # and per-column bulk formatting instead of iterrows + .loc
             headers = ["Bus ID", "Name", "Vn (kV)", "V (p.u.)", "Angle (°)", "P (MW)", "Q (Mvar)"]
-            table_data = []
-            
-            for idx, row in net.res_bus.iterrows():
-                if idx in net.bus.index:
-                    bus_data = net.bus.loc[idx]
-                    bus_name = bus_data.get("name", f"Bus {idx}")
-                    vn_kv = bus_data["vn_kv"]
-                else:
-                    bus_name = f"Bus {idx}"
-                    vn_kv = 0.0
-                
-                vm_pu = row["vm_pu"]
-                va_degree = row["va_degree"]
-                p_mw = row["p_mw"]
-                q_mvar = row["q_mvar"]
-                
-                table_data.append([
-                    idx, bus_name, f"{vn_kv:.1f}", f"{vm_pu:.3f}", 
-                    f"{va_degree:.1f}", f"{p_mw:.2f}", f"{q_mvar:.2f}"
-                ])
-            
-            print(tabulate(table_data, headers=headers, tablefmt="grid"))
+
+            df = net.res_bus.join(net.bus[['name', 'vn_kv']], how='left')
+            names = df['name'].where(df['name'].notna(), df.index.map('Bus {}'.format))
+            vn_kv = df['vn_kv'].fillna(0.0)
+
+            table_data = list(zip(
+                df.index,
+                names,
+                np.char.mod('%.1f', vn_kv.to_numpy()),
+                np.char.mod('%.3f', df['vm_pu'].to_numpy()),
+                np.char.mod('%.1f', df['va_degree'].to_numpy()),
+                np.char.mod('%.2f', df['p_mw'].to_numpy()),
+                np.char.mod('%.2f', df['q_mvar'].to_numpy()),
+            ))
+
+            print(_render_table(table_data, headers))
         else:
-            # Summary statistics only
-            voltages = net.res_bus['vm_pu']
-            print(f"  Buses analyzed: {len(voltages)}")
+            # Summary statistics only — pull the column once and compute all
+            # five quantities from the same buffer without mask DataFrames
+            voltages = net.res_bus['vm_pu'].to_numpy()
+            print(f"  Buses analyzed: {voltages.size}")
             print(f"  Max voltage: {voltages.max():.3f} p.u.")
             print(f"  Min voltage: {voltages.min():.3f} p.u.")
             print(f"  Average voltage: {voltages.mean():.3f} p.u.")
-            
+
             # Voltage violations
-            low_violations = len(voltages[voltages < 0.97])
-            high_violations = len(voltages[voltages > 1.03])
+            low_violations = int(np.count_nonzero(voltages < 0.97))
+            high_violations = int(np.count_nonzero(voltages > 1.03))
             if low_violations > 0 or high_violations > 0:
                 print(f"  ⚠ Voltage violations: {low_violations} low, {high_violations} high")
     
     def _display_line_results(self, detailed: bool):
         """Display line power flow results."""
+        import numpy as np
+
         net = self.current_net
         
         print(f"\nLINE FLOW RESULTS:")
         
         if detailed:
-            headers = ["Line ID", "From", "To", "Vn (kV)", "P from (MW)", "Q from (Mvar)", 
+            headers = ["Line ID", "From", "To", "Vn (kV)", "P from (MW)", "Q from (Mvar)",
                       "I from (kA)", "Loading (%)"]
-            table_data = []
-            
-            for idx, row in net.res_line.iterrows():
-                if idx in net.line.index:
-                    line_data = net.line.loc[idx]
-                    from_bus = int(line_data["from_bus"])
-                    to_bus = int(line_data["to_bus"])
-                    # Get voltage level from from_bus
-                    if from_bus in net.bus.index:
-                        vn_kv = net.bus.loc[from_bus, "vn_kv"]
-                    else:
-                        vn_kv = 0.0
-                else:
-                    from_bus = 0
-                    to_bus = 0
-                    vn_kv = 0.0
-                
-                p_from_mw = row["p_from_mw"]
-                q_from_mvar = row["q_from_mvar"]
-                i_from_ka = row["i_from_ka"]
-                loading_percent = row["loading_percent"]
-                
-                table_data.append([
-                    idx, from_bus, to_bus, f"{vn_kv:.0f}", f"{p_from_mw:.2f}", 
-                    f"{q_from_mvar:.2f}", f"{i_from_ka:.4f}", f"{loading_percent:.1f}"
-                ])
-            
-            print(tabulate(table_data, headers=headers, tablefmt="grid"))
+
+            # Hoist the bus-voltage lookup into one vectorized gather instead
+            # of a per-row .loc chain
+            line_df = net.line.reindex(net.res_line.index)
+            from_bus = line_df['from_bus'].fillna(0).to_numpy(np.int64)
+            to_bus = line_df['to_bus'].fillna(0).to_numpy(np.int64)
+
+            vn_lookup = net.bus['vn_kv'].to_numpy()
+            bus_pos = net.bus.index.get_indexer(from_bus)
+            vn_kv = np.where(bus_pos >= 0, vn_lookup[bus_pos], 0.0)
+
+            table_data = list(zip(
+                net.res_line.index,
+                from_bus,
+                to_bus,
+                np.char.mod('%.0f', vn_kv),
+                np.char.mod('%.2f', net.res_line['p_from_mw'].to_numpy()),
+                np.char.mod('%.2f', net.res_line['q_from_mvar'].to_numpy()),
+                np.char.mod('%.4f', net.res_line['i_from_ka'].to_numpy()),
+                np.char.mod('%.1f', net.res_line['loading_percent'].to_numpy()),
+            ))
+
+            print(_render_table(table_data, headers))
         else:
             # Summary statistics
-            loadings = net.res_line['loading_percent']
-            print(f"  Lines analyzed: {len(loadings)}")
+            loadings = net.res_line['loading_percent'].to_numpy()
+            print(f"  Lines analyzed: {loadings.size}")
             print(f"  Max loading: {loadings.max():.1f}%")
             print(f"  Average loading: {loadings.mean():.1f}%")
-            
+
             # Overload violations
-            overloads = len(loadings[loadings > 85])
+            overloads = int(np.count_nonzero(loadings > 85))
             if overloads > 0:
                 print(f"  ⚠ Overloaded lines (>85%): {overloads}")
     
     def _display_transformer_results(self, detailed: bool):
         """Display transformer results."""
+        import numpy as np
+
         net = self.current_net
         
         print(f"\nTRANSFORMER RESULTS:")
         
         if detailed:
-            headers = ["Trafo ID", "Name", "HV Bus", "LV Bus", "HV kV", "LV kV", 
+            headers = ["Trafo ID", "Name", "HV Bus", "LV Bus", "HV kV", "LV kV",
                       "P HV (MW)", "Loading (%)"]
-            table_data = []
-            
-            for idx, row in net.res_trafo.iterrows():
-                if idx in net.trafo.index:
-                    trafo_data = net.trafo.loc[idx]
-                    trafo_name = trafo_data.get("name", f"Trafo {idx}")
-                    hv_bus = int(trafo_data["hv_bus"])
-                    lv_bus = int(trafo_data["lv_bus"])
-                    vn_hv_kv = trafo_data.get("vn_hv_kv", 0.0)
-                    vn_lv_kv = trafo_data.get("vn_lv_kv", 0.0)
-                else:
-                    trafo_name = f"Trafo {idx}"
-                    hv_bus = 0
-                    lv_bus = 0
-                    vn_hv_kv = 0.0
-                    vn_lv_kv = 0.0
-                
-                p_hv_mw = row["p_hv_mw"]
-                loading_percent = row["loading_percent"]
-                
-                table_data.append([
-                    idx, trafo_name, hv_bus, lv_bus, f"{vn_hv_kv:.0f}", 
-                    f"{vn_lv_kv:.0f}", f"{p_hv_mw:.2f}", f"{loading_percent:.1f}"
-                ])
-            
-            print(tabulate(table_data, headers=headers, tablefmt="grid"))
+
+            df = net.res_trafo.join(net.trafo[['name', 'hv_bus', 'lv_bus', 'vn_hv_kv', 'vn_lv_kv']], how='left')
+            names = df['name'].where(df['name'].notna(), df.index.map('Trafo {}'.format))
+
+            table_data = list(zip(
+                df.index,
+                names,
+                df['hv_bus'].fillna(0).astype(int),
+                df['lv_bus'].fillna(0).astype(int),
+                np.char.mod('%.0f', df['vn_hv_kv'].fillna(0.0).to_numpy()),
+                np.char.mod('%.0f', df['vn_lv_kv'].fillna(0.0).to_numpy()),
+                np.char.mod('%.2f', df['p_hv_mw'].to_numpy()),
+                np.char.mod('%.1f', df['loading_percent'].to_numpy()),
+            ))
+
+            print(_render_table(table_data, headers))
         else:
             # Summary statistics
-            loadings = net.res_trafo['loading_percent']
-            print(f"  Transformers analyzed: {len(loadings)}")
+            loadings = net.res_trafo['loading_percent'].to_numpy()
+            print(f"  Transformers analyzed: {loadings.size}")
             print(f"  Max loading: {loadings.max():.1f}%")
             print(f"  Average loading: {loadings.mean():.1f}%")
-            
+
             # Overload violations
-            overloads = len(loadings[loadings > 85])
+            overloads = int(np.count_nonzero(loadings > 85))
             if overloads > 0:
                 print(f"  ⚠ Overloaded transformers (>85%): {overloads}")
     
     def _display_generator_results(self, detailed: bool):
         """Display generator results."""
+        import numpy as np
+
         net = self.current_net
         
         print(f"\nGENERATOR RESULTS:")
         
         if detailed:
             headers = ["Gen ID", "Name", "Bus", "P (MW)", "Q (Mvar)", "V (p.u.)", "Slack"]
-            table_data = []
-            
-            for idx, row in net.res_gen.iterrows():
-                if idx in net.gen.index:
-                    gen_data = net.gen.loc[idx]
-                    gen_name = gen_data.get("name", f"Gen {idx}")
-                    bus = int(gen_data["bus"])
-                    is_slack = gen_data.get("slack", False)
-                    slack_text = "Yes" if is_slack else "No"
-                else:
-                    gen_name = f"Gen {idx}"
-                    bus = 0
-                    slack_text = "No"
-                
-                p_mw = row["p_mw"]
-                q_mvar = row["q_mvar"]
-                vm_pu = row["vm_pu"]
-                
-                table_data.append([
-                    idx, gen_name, bus, f"{p_mw:.2f}", f"{q_mvar:.2f}", 
-                    f"{vm_pu:.3f}", slack_text
-                ])
-            
-            print(tabulate(table_data, headers=headers, tablefmt="grid"))
+
+            df = net.res_gen.join(net.gen[['name', 'bus', 'slack']], how='left')
+            names = df['name'].where(df['name'].notna(), df.index.map('Gen {}'.format))
+            slack_text = df['slack'].fillna(False).map({True: "Yes", False: "No"})
+
+            table_data = list(zip(
+                df.index,
+                names,
+                df['bus'].fillna(0).astype(int),
+                np.char.mod('%.2f', df['p_mw'].to_numpy()),
+                np.char.mod('%.2f', df['q_mvar'].to_numpy()),
+                np.char.mod('%.3f', df['vm_pu'].to_numpy()),
+                slack_text,
+            ))
+
+            print(_render_table(table_data, headers))
         else:
             # Summary statistics
             total_p = net.res_gen['p_mw'].sum()
@@ -421,9 +480,13 @@ class TerminalLoadFlow:
         
         try:
             print(f"\nRunning base case analysis on {self.current_grid_name}...")
-            
-            contingency = ContingencyAnalysis(self.current_net)
-            base_case = contingency._analyze_base_case()
+
+            contingency = self._get_contingency()
+
+            # Reuse an existing power flow solution instead of re-solving;
+            # the analyzer's deepcopy carries the res_* tables along
+            already_solved = hasattr(self.current_net, 'res_bus') and not self.current_net.res_bus.empty
+            base_case = contingency._analyze_base_case(skip_solve=already_solved)
             
             if not base_case:
                 print("Failed to analyze base case")
@@ -440,10 +503,9 @@ class TerminalLoadFlow:
                 
                 if contingency.violations:
                     print(f"\nBASE CASE VIOLATIONS DETAIL:")
-                    
-                    voltage_violations = [v for v in contingency.violations if 'Voltage' in v['violation_type']]
-                    current_violations = [v for v in contingency.violations if 'Overload' in v['violation_type']]
-                    
+
+                    voltage_violations, current_violations = _partition_violations(contingency.violations)
+
                     if voltage_violations:
                         print(f"\nVOLTAGE VIOLATIONS:")
                         headers = ["Element", "Type", "Value", "Limit", "Severity"]
@@ -456,7 +518,7 @@ class TerminalLoadFlow:
                                 v['limit_value'],
                                 v['severity']
                             ])
-                        print(tabulate(table_data, headers=headers, tablefmt="grid"))
+                        print(_render_table(table_data, headers))
                     
                     if current_violations:
                         print(f"\nOVERLOAD VIOLATIONS:")
@@ -470,7 +532,7 @@ class TerminalLoadFlow:
                                 v['limit_value'],
                                 v['severity']
                             ])
-                        print(tabulate(table_data, headers=headers, tablefmt="grid"))
+                        print(_render_table(table_data, headers))
             
             return True
             
@@ -484,6 +546,8 @@ class TerminalLoadFlow:
             print("Error: No grid loaded")
             return False
         
+        from convergence_diagnostic import ConvergenceDiagnostic
+
         try:
             diagnostic = ConvergenceDiagnostic(self.current_net)
             results = diagnostic.run_full_diagnostic()
@@ -501,9 +565,16 @@ class TerminalLoadFlow:
         
         try:
             print(f"\nRunning N-1 contingency analysis on {self.current_grid_name}...")
-            
-            contingency = ContingencyAnalysis(self.current_net)
-            results = contingency.run_n1_analysis()
+
+            contingency = self._get_contingency()
+
+            # Fan larger sweeps out across a process pool; for small grids
+            # the sequential path avoids worker startup overhead
+            n_outages = len(self.current_net.line) + len(self.current_net.trafo) + len(self.current_net.gen)
+            if n_outages > 20 and (os.cpu_count() or 1) > 1:
+                results = contingency.run_n1_analysis_parallel()
+            else:
+                results = contingency.run_n1_analysis()
             
             if not results:
                 print("No contingency results generated")
@@ -525,33 +596,29 @@ class TerminalLoadFlow:
             print(f"  Medium severity: {summary.get('medium_severity', 0)}")
             print(f"  Low severity: {summary.get('low_severity', 0)}")
             
-            # Display critical contingencies
-            critical_contingencies = [r for r in results if r['severity'] in ['Critical', 'High'] and r['contingency_type'] != 'Base Case']
-            if critical_contingencies:
+            # Display critical contingencies: one vectorized filter plus a
+            # partial sort so the table shows the 10 worst by loading
+            import pandas as pd
+
+            results_df = contingency.as_dataframe()
+            critical_mask = (results_df['severity'].isin(['Critical', 'High'])
+                             & (results_df['contingency_type'] != 'Base Case'))
+            critical_df = results_df[critical_mask]
+            if not critical_df.empty:
                 print(f"\nCRITICAL CONTINGENCIES:")
                 headers = ["Type", "Element", "Severity", "Max V (p.u.)", "Min V (p.u.)", "Max Loading (%)"]
-                table_data = []
-                
-                for c in critical_contingencies[:10]:  # Show top 10
-                    max_loading = max(c.get('max_line_loading', 0), c.get('max_trafo_loading', 0))
-                    table_data.append([
-                        c['contingency_type'].replace(' Outage', ''),
-                        c['element_name'][:20],  # Truncate long names
-                        c['severity'],
-                        f"{c.get('max_voltage_pu', 0):.3f}",
-                        f"{c.get('min_voltage_pu', 0):.3f}",
-                        f"{max_loading:.1f}"
-                    ])
-                
-                print(tabulate(table_data, headers=headers, tablefmt="grid"))
+
+                max_loading = critical_df.reindex(columns=['max_line_loading', 'max_trafo_loading']).fillna(0).max(axis=1)
+                top10 = critical_df.assign(_max_loading=max_loading).nlargest(10, '_max_loading')
+                table_data = [_critical_row_fmt(c) for c in top10.fillna(0).to_dict('records')]
+                print(_render_table(table_data, headers))
             
             # Display violations if any
             if contingency.violations:
                 print(f"\nVIOLATIONS DETECTED: {len(contingency.violations)}")
                 
-                voltage_violations = [v for v in contingency.violations if 'Voltage' in v['violation_type']]
-                current_violations = [v for v in contingency.violations if 'Overload' in v['violation_type']]
-                
+                voltage_violations, current_violations = _partition_violations(contingency.violations)
+
                 print(f"  Voltage violations: {len(voltage_violations)}")
                 print(f"  Current violations: {len(current_violations)}")
                 
@@ -583,21 +650,44 @@ class TerminalLoadFlow:
         if self.current_net is None or not hasattr(self.current_net, 'res_bus'):
             print("Error: No power flow results available")
             return False
-        
+
+        import pandas as pd
+
         try:
-            # Create results dictionary
+            # Reference the result frames directly — the writer only reads
+            # them, so copying would just double peak memory
             results = {
-                'bus_results': self.current_net.res_bus.copy(),
-                'line_results': self.current_net.res_line.copy() if hasattr(self.current_net, 'res_line') else pd.DataFrame(),
-                'trafo_results': self.current_net.res_trafo.copy() if hasattr(self.current_net, 'res_trafo') else pd.DataFrame(),
-                'gen_results': self.current_net.res_gen.copy() if hasattr(self.current_net, 'res_gen') else pd.DataFrame()
+                'bus_results': self.current_net.res_bus,
+                'line_results': self.current_net.res_line if hasattr(self.current_net, 'res_line') else pd.DataFrame(),
+                'trafo_results': self.current_net.res_trafo if hasattr(self.current_net, 'res_trafo') else pd.DataFrame(),
+                'gen_results': self.current_net.res_gen if hasattr(self.current_net, 'res_gen') else pd.DataFrame()
             }
-            
-            # Export to Excel with multiple sheets
+
             base_name = filename.rsplit('.', 1)[0]
+            total_rows = sum(len(df) for df in results.values())
+
+            # Large outputs go to streamed CSV — Excel writers allocate per
+            # cell and become the bottleneck well before 10k rows
+            if total_rows > 10000:
+                for key, df in results.items():
+                    if not df.empty:
+                        csv_file = f"{base_name}_{key}.csv"
+                        df.to_csv(csv_file, chunksize=65536)
+                        print(f"✓ {key} exported to {csv_file}")
+                return True
+
+            # Export to Excel with multiple sheets; xlsxwriter streams rows
+            # instead of buffering the whole workbook like openpyxl
             excel_file = f"{base_name}.xlsx"
-            
-            with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
+
+            try:
+                import xlsxwriter  # noqa: F401
+                writer_kwargs = {'engine': 'xlsxwriter',
+                                 'engine_kwargs': {'options': {'constant_memory': True}}}
+            except ImportError:
+                writer_kwargs = {'engine': 'openpyxl'}
+
+            with pd.ExcelWriter(excel_file, **writer_kwargs) as writer:
                 results['bus_results'].to_excel(writer, sheet_name='Bus_Results')
                 if not results['line_results'].empty:
                     results['line_results'].to_excel(writer, sheet_name='Line_Results')
@@ -615,6 +705,8 @@ class TerminalLoadFlow:
     
     def _export_contingency_results(self, results: List, violations: List, filename: str):
         """Export contingency analysis results."""
+        import pandas as pd
+
         try:
             base_name = filename.rsplit('.', 1)[0]
             
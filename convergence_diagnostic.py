@@ -1,13 +1,32 @@
 #!/usr/bin/env python3
 """Diagnostic tool for power flow convergence issues."""
 
+import pickle
 import sys
+import networkx as nx
 import pandas as pd
 import pandapower as pp
 import numpy as np
 from typing import Dict, List, Any, Optional
+import diag_kernels
 from examples import create_example_grid, create_ieee_9_bus, create_ieee_39_bus, create_ieee_39_bus_standard
 
+# lightsim2grid's native solver is the fastest Newton-Raphson path, but it
+# only backs algorithm='nr'; numba=True is pandapower's default when numba
+# is installed, so only the backend needs opting into per run
+try:
+    import lightsim2grid  # noqa: F401
+    _HAS_LIGHTSIM = True
+except ImportError:
+    _HAS_LIGHTSIM = False
+
+
+def _solver_kwargs(options: Dict[str, Any]) -> Dict[str, Any]:
+    """Solver speed-up kwargs applicable to the given runpp options."""
+    if _HAS_LIGHTSIM and options.get('algorithm', 'nr') == 'nr':
+        return {'lightsim2grid': True}
+    return {}
+
 
 class ConvergenceDiagnostic:
     """Diagnostic tool to identify power flow convergence issues."""
@@ -18,40 +37,90 @@ class ConvergenceDiagnostic:
         self.issues = []
         self.warnings = []
         self.info = []
-    
-    def run_full_diagnostic(self) -> Dict[str, Any]:
-        """Run complete diagnostic analysis."""
-        print("="*60)
-        print("POWER FLOW CONVERGENCE DIAGNOSTIC")
-        print("="*60)
-        
-        # Network topology checks
-        self._check_network_topology()
-        
-        # Power balance checks
-        self._check_power_balance()
-        
-        # Voltage and impedance checks
-        self._check_voltage_levels()
-        
-        # Generator checks
-        self._check_generators()
-        
-        # Load checks
-        self._check_loads()
-        
-        # Connectivity checks
-        self._check_connectivity()
-        
-        # Line parameter checks
-        self._check_line_parameters()
-        
-        # Try different solver settings
-        self._test_solver_options()
-        
+        # Bus-index lookup structures shared by the checks; the bus table
+        # never changes during a diagnostic run, so build them once instead
+        # of re-probing pandas Index hashtables per row
+        self._bus_index_arr = net.bus.index.to_numpy()
+        self._bus_index_set = frozenset(self._bus_index_arr.tolist())
+        # Output lines are buffered here and flushed in one stdout write by
+        # _display_summary, instead of one locked flush per print call
+        self._out_lines: List[str] = []
+        # In-service subsets are shared across checks; boolean indexing
+        # copies the selected rows, so build each one at most once per run
+        self._active_cache: Dict[str, pd.DataFrame] = {}
+
+    def _active(self, table: str) -> pd.DataFrame:
+        """Memoized in-service subset of an element table."""
+        if table not in self._active_cache:
+            frame = getattr(self.net, table)
+            self._active_cache[table] = frame[frame['in_service']]
+        return self._active_cache[table]
+
+    def _p(self, line: str = "") -> None:
+        """Buffer one output line for the next flush."""
+        self._out_lines.append(line + "\n")
+
+    def _flush_output(self) -> None:
+        """Emit all buffered output in a single write."""
+        if self._out_lines:
+            sys.stdout.write("".join(self._out_lines))
+            self._out_lines.clear()
+
+    @staticmethod
+    def _element_names(table: pd.DataFrame, prefix: str) -> List[str]:
+        """Positional display names for a table ('name' column, else 'Prefix idx')."""
+        idx = table.index.to_numpy()
+        if 'name' in table.columns:
+            return [n if isinstance(n, str) else f"{prefix} {i}"
+                    for i, n in zip(idx, table['name'].to_numpy(dtype=object))]
+        return [f"{prefix} {i}" for i in idx]
+
+
+    # Conditions after which later passes (in particular the solver sweep)
+    # cannot produce anything useful
+    _HARD_STOPS = (
+        "Network has no buses",
+        "Network has no generation sources",
+    )
+
+    def run_full_diagnostic(self, checks: Optional[set] = None,
+                            skip_solver_tests: bool = False) -> Dict[str, Any]:
+        """Run complete diagnostic analysis.
+
+        checks optionally restricts which passes run (by name, e.g.
+        {'topology', 'power_balance'}); skip_solver_tests drops only the
+        solver sweep, which is by far the most expensive pass since it runs
+        the power flow once per candidate configuration.
+        """
+        self._p("="*60)
+        self._p("POWER FLOW CONVERGENCE DIAGNOSTIC")
+        self._p("="*60)
+
+        passes = [
+            ('topology', self._check_network_topology),
+            ('power_balance', self._check_power_balance),
+            ('voltage_levels', self._check_voltage_levels),
+            ('generators', self._check_generators),
+            ('loads', self._check_loads),
+            ('connectivity', self._check_connectivity),
+            ('line_parameters', self._check_line_parameters),
+            ('solver_options', self._test_solver_options),
+        ]
+
+        for name, method in passes:
+            if checks is not None and name not in checks:
+                continue
+            if name == 'solver_options' and skip_solver_tests:
+                continue
+            method()
+            # An empty or generation-less network cannot converge under any
+            # solver setting; stop instead of paying for the remaining passes
+            if any(issue in self._HARD_STOPS for issue in self.issues):
+                break
+
         # Display summary
         self._display_summary()
-        
+
         return {
             'issues': self.issues,
             'warnings': self.warnings,
@@ -60,7 +129,7 @@ class ConvergenceDiagnostic:
     
     def _check_network_topology(self):
         """Check basic network topology."""
-        print("\n1. NETWORK TOPOLOGY CHECK:")
+        self._p("\n1. NETWORK TOPOLOGY CHECK:")
         
         # Basic network statistics
         n_buses = len(self.net.bus)
@@ -70,12 +139,12 @@ class ConvergenceDiagnostic:
         n_ext_grids = len(self.net.ext_grid) if hasattr(self.net, 'ext_grid') else 0
         n_loads = len(self.net.load) if hasattr(self.net, 'load') else 0
         
-        print(f"  Buses: {n_buses}")
-        print(f"  Lines: {n_lines}")
-        print(f"  Transformers: {n_trafos}")
-        print(f"  Generators: {n_gens}")
-        print(f"  External grids: {n_ext_grids}")
-        print(f"  Loads: {n_loads}")
+        self._p(f"  Buses: {n_buses}")
+        self._p(f"  Lines: {n_lines}")
+        self._p(f"  Transformers: {n_trafos}")
+        self._p(f"  Generators: {n_gens}")
+        self._p(f"  External grids: {n_ext_grids}")
+        self._p(f"  Loads: {n_loads}")
         
         # Check for empty network
         if n_buses == 0:
@@ -91,7 +160,7 @@ class ConvergenceDiagnostic:
     
     def _check_power_balance(self):
         """Check power balance between generation and load."""
-        print("\n2. POWER BALANCE CHECK:")
+        self._p("\n2. POWER BALANCE CHECK:")
         
         total_gen_p = 0.0
         total_gen_q = 0.0
@@ -100,26 +169,26 @@ class ConvergenceDiagnostic:
         
         # Sum generation
         if hasattr(self.net, 'gen') and not self.net.gen.empty:
-            active_gens = self.net.gen[self.net.gen['in_service']]
+            active_gens = self._active('gen')
             total_gen_p += active_gens['p_mw'].sum()
             # Q is not specified for PV generators in input
             
         if hasattr(self.net, 'ext_grid') and not self.net.ext_grid.empty:
             # External grid provides unlimited power
-            print("  External grid present (unlimited power source)")
+            self._p("  External grid present (unlimited power source)")
         
         # Sum loads
         if hasattr(self.net, 'load') and not self.net.load.empty:
-            active_loads = self.net.load[self.net.load['in_service']]
+            active_loads = self._active('load')
             total_load_p += active_loads['p_mw'].sum()
             total_load_q += active_loads['q_mvar'].sum()
         
-        print(f"  Total generation: {total_gen_p:.1f} MW")
-        print(f"  Total load: {total_load_p:.1f} MW")
-        print(f"  Power imbalance: {total_gen_p - total_load_p:.1f} MW")
+        self._p(f"  Total generation: {total_gen_p:.1f} MW")
+        self._p(f"  Total load: {total_load_p:.1f} MW")
+        self._p(f"  Power imbalance: {total_gen_p - total_load_p:.1f} MW")
         
         if hasattr(self.net, 'ext_grid') and not self.net.ext_grid.empty:
-            print("  Note: External grid will compensate for any imbalance")
+            self._p("  Note: External grid will compensate for any imbalance")
         else:
             imbalance = abs(total_gen_p - total_load_p)
             if imbalance > 0.1 * max(total_gen_p, total_load_p):
@@ -129,13 +198,13 @@ class ConvergenceDiagnostic:
     
     def _check_voltage_levels(self):
         """Check voltage level consistency."""
-        print("\n3. VOLTAGE LEVEL CHECK:")
+        self._p("\n3. VOLTAGE LEVEL CHECK:")
         
         if self.net.bus.empty:
             return
             
         voltage_levels = self.net.bus['vn_kv'].unique()
-        print(f"  Voltage levels in network: {sorted(voltage_levels)} kV")
+        self._p(f"  Voltage levels in network: {sorted(voltage_levels)} kV")
         
         # Check for unrealistic voltage levels
         for vn in voltage_levels:
@@ -146,35 +215,35 @@ class ConvergenceDiagnostic:
             elif vn > 1000:
                 self.warnings.append(f"Very high voltage level: {vn} kV")
         
-        # Check line voltage level consistency
+        # Check line voltage level consistency: one reindex per endpoint
+        # column replaces two .loc hashtable lookups per line row; lines
+        # referencing unknown buses come back NaN and are skipped like before
         if hasattr(self.net, 'line') and not self.net.line.empty:
-            for idx, line in self.net.line.iterrows():
-                from_bus = line['from_bus']
-                to_bus = line['to_bus']
-                
-                if from_bus in self.net.bus.index and to_bus in self.net.bus.index:
-                    from_vn = self.net.bus.loc[from_bus, 'vn_kv']
-                    to_vn = self.net.bus.loc[to_bus, 'vn_kv']
-                    
-                    if from_vn != to_vn:
-                        line_name = line.get('name', f'Line {idx}')
-                        self.issues.append(f"Line {line_name} connects different voltage levels: {from_vn} kV to {to_vn} kV")
+            vn_map = self.net.bus['vn_kv']
+            from_vn = vn_map.reindex(self.net.line['from_bus']).to_numpy()
+            to_vn = vn_map.reindex(self.net.line['to_bus']).to_numpy()
+            names = self._element_names(self.net.line, 'Line')
+
+            mismatch = (from_vn != to_vn) & ~np.isnan(from_vn) & ~np.isnan(to_vn)
+            for pos in np.flatnonzero(mismatch):
+                self.issues.append(f"Line {names[pos]} connects different voltage levels: "
+                                   f"{from_vn[pos]} kV to {to_vn[pos]} kV")
     
     def _check_generators(self):
         """Check generator configuration."""
-        print("\n4. GENERATOR CHECK:")
+        self._p("\n4. GENERATOR CHECK:")
         
         if not hasattr(self.net, 'gen') or self.net.gen.empty:
             if not hasattr(self.net, 'ext_grid') or self.net.ext_grid.empty:
                 self.issues.append("No generators or external grids in network")
             return
         
-        active_gens = self.net.gen[self.net.gen['in_service']]
+        active_gens = self._active('gen')
         slack_gens = active_gens[active_gens['slack']]
         
-        print(f"  Total generators: {len(self.net.gen)}")
-        print(f"  Active generators: {len(active_gens)}")
-        print(f"  Slack generators: {len(slack_gens)}")
+        self._p(f"  Total generators: {len(self.net.gen)}")
+        self._p(f"  Active generators: {len(active_gens)}")
+        self._p(f"  Slack generators: {len(slack_gens)}")
         
         # Check for slack bus
         has_ext_grid = hasattr(self.net, 'ext_grid') and not self.net.ext_grid.empty
@@ -183,156 +252,174 @@ class ConvergenceDiagnostic:
         elif len(slack_gens) > 1:
             self.warnings.append(f"Multiple slack generators found: {len(slack_gens)}")
         
-        # Check generator parameters
-        for idx, gen in active_gens.iterrows():
-            gen_name = gen.get('name', f'Gen {idx}')
-            
+        # Check generator parameters; itertuples yields plain tuples instead
+        # of boxing each row into a dtype-upcast Series like iterrows
+        names = self._element_names(active_gens, 'Gen')
+        rows = active_gens[['p_mw', 'vm_pu', 'bus']].itertuples(index=False, name=None)
+        for gen_name, (p_mw, vm_pu, bus) in zip(names, rows):
             # Check power output
-            if gen['p_mw'] < 0:
-                self.warnings.append(f"{gen_name}: Negative power output {gen['p_mw']} MW")
-            elif gen['p_mw'] > 2000:
-                self.warnings.append(f"{gen_name}: Very large power output {gen['p_mw']} MW")
-            
+            if p_mw < 0:
+                self.warnings.append(f"{gen_name}: Negative power output {p_mw} MW")
+            elif p_mw > 2000:
+                self.warnings.append(f"{gen_name}: Very large power output {p_mw} MW")
+
             # Check voltage setpoint
-            if gen['vm_pu'] < 0.9 or gen['vm_pu'] > 1.1:
-                self.warnings.append(f"{gen_name}: Unusual voltage setpoint {gen['vm_pu']} p.u.")
-            
+            if vm_pu < 0.9 or vm_pu > 1.1:
+                self.warnings.append(f"{gen_name}: Unusual voltage setpoint {vm_pu} p.u.")
+
             # Check bus connection
-            if gen['bus'] not in self.net.bus.index:
-                self.issues.append(f"{gen_name}: Connected to non-existent bus {gen['bus']}")
+            if bus not in self._bus_index_set:
+                self.issues.append(f"{gen_name}: Connected to non-existent bus {bus}")
     
     def _check_loads(self):
         """Check load configuration."""
-        print("\n5. LOAD CHECK:")
+        self._p("\n5. LOAD CHECK:")
         
         if not hasattr(self.net, 'load') or self.net.load.empty:
             self.warnings.append("No loads in network")
             return
         
-        active_loads = self.net.load[self.net.load['in_service']]
-        print(f"  Total loads: {len(self.net.load)}")
-        print(f"  Active loads: {len(active_loads)}")
-        
-        # Check load parameters
-        for idx, load in active_loads.iterrows():
-            load_name = load.get('name', f'Load {idx}')
-            
-            # Check power consumption
-            if load['p_mw'] < 0:
-                self.warnings.append(f"{load_name}: Negative active power {load['p_mw']} MW")
-            elif load['p_mw'] > 1000:
-                self.warnings.append(f"{load_name}: Very large active power {load['p_mw']} MW")
-            
-            # Check reactive power
-            if abs(load['q_mvar']) > 2 * load['p_mw']:
-                self.warnings.append(f"{load_name}: Unusual reactive power {load['q_mvar']} Mvar")
-            
-            # Check bus connection
-            if load['bus'] not in self.net.bus.index:
-                self.issues.append(f"{load_name}: Connected to non-existent bus {load['bus']}")
+        active_loads = self._active('load')
+        self._p(f"  Total loads: {len(self.net.load)}")
+        self._p(f"  Active loads: {len(active_loads)}")
+
+        # Check load parameters: four vectorized comparisons, then format
+        # messages only for the rows that tripped at least one of them
+        p = active_loads['p_mw'].to_numpy()
+        q = active_loads['q_mvar'].to_numpy()
+        bus = active_loads['bus'].to_numpy()
+        names = self._element_names(active_loads, 'Load')
+
+        neg = p < 0
+        huge = p > 1000
+        qbad = np.abs(q) > 2 * p
+        missing = ~np.isin(bus, self._bus_index_arr)
+
+        for pos in np.flatnonzero(neg | huge | qbad | missing):
+            load_name = names[pos]
+            if neg[pos]:
+                self.warnings.append(f"{load_name}: Negative active power {p[pos]} MW")
+            elif huge[pos]:
+                self.warnings.append(f"{load_name}: Very large active power {p[pos]} MW")
+            if qbad[pos]:
+                self.warnings.append(f"{load_name}: Unusual reactive power {q[pos]} Mvar")
+            if missing[pos]:
+                self.issues.append(f"{load_name}: Connected to non-existent bus {bus[pos]}")
     
     def _check_connectivity(self):
         """Check network connectivity."""
-        print("\n6. CONNECTIVITY CHECK:")
+        self._p("\n6. CONNECTIVITY CHECK:")
         
         try:
             # Use pandapower's topology functions
             mg = pp.topology.create_nxgraph(self.net)
             
             # Check if network is connected
-            import networkx as nx
             if not nx.is_connected(mg):
                 self.issues.append("Network is not fully connected (has isolated islands)")
                 
                 # Find connected components
                 components = list(nx.connected_components(mg))
-                print(f"  Network has {len(components)} separate components")
+                self._p(f"  Network has {len(components)} separate components")
                 for i, comp in enumerate(components):
-                    print(f"    Component {i+1}: {len(comp)} buses")
+                    self._p(f"    Component {i+1}: {len(comp)} buses")
             else:
-                print("  Network is fully connected ✓")
+                self._p("  Network is fully connected ✓")
                 
         except Exception as e:
             self.warnings.append(f"Could not check connectivity: {e}")
     
     def _check_line_parameters(self):
         """Check line and transformer parameters."""
-        print("\n7. LINE PARAMETER CHECK:")
+        self._p("\n7. LINE PARAMETER CHECK:")
         
-        # Check lines
+        # Check lines: one compiled pass over the parameter columns, then
+        # format messages only for the (typically empty) offending rows
         if hasattr(self.net, 'line') and not self.net.line.empty:
-            for idx, line in self.net.line.iterrows():
-                line_name = line.get('name', f'Line {idx}')
-                
-                # Check impedance parameters
-                if line['r_ohm_per_km'] <= 0:
-                    self.issues.append(f"{line_name}: Invalid resistance {line['r_ohm_per_km']}")
-                if line['x_ohm_per_km'] <= 0:
-                    self.issues.append(f"{line_name}: Invalid reactance {line['x_ohm_per_km']}")
-                if line['length_km'] <= 0:
-                    self.issues.append(f"{line_name}: Invalid length {line['length_km']}")
-                
-                # Check for unrealistic values
-                if line['r_ohm_per_km'] > 10:
-                    self.warnings.append(f"{line_name}: High resistance {line['r_ohm_per_km']} Ω/km")
-                if line['x_ohm_per_km'] > 10:
-                    self.warnings.append(f"{line_name}: High reactance {line['x_ohm_per_km']} Ω/km")
-        
+            line = self.net.line
+            names = self._element_names(line, 'Line')
+            r = line['r_ohm_per_km'].to_numpy()
+            x = line['x_ohm_per_km'].to_numpy()
+            length = line['length_km'].to_numpy()
+            mask = diag_kernels.scan_lines(r, x, length)
+
+            for pos in np.flatnonzero(mask & diag_kernels.LINE_R_NONPOS):
+                self.issues.append(f"{names[pos]}: Invalid resistance {r[pos]}")
+            for pos in np.flatnonzero(mask & diag_kernels.LINE_X_NONPOS):
+                self.issues.append(f"{names[pos]}: Invalid reactance {x[pos]}")
+            for pos in np.flatnonzero(mask & diag_kernels.LINE_LENGTH_NONPOS):
+                self.issues.append(f"{names[pos]}: Invalid length {length[pos]}")
+
+            for pos in np.flatnonzero(mask & diag_kernels.LINE_R_HIGH):
+                self.warnings.append(f"{names[pos]}: High resistance {r[pos]} Ω/km")
+            for pos in np.flatnonzero(mask & diag_kernels.LINE_X_HIGH):
+                self.warnings.append(f"{names[pos]}: High reactance {x[pos]} Ω/km")
+
         # Check transformers
         if hasattr(self.net, 'trafo') and not self.net.trafo.empty:
-            for idx, trafo in self.net.trafo.iterrows():
-                trafo_name = trafo.get('name', f'Trafo {idx}')
-                
-                # Check basic parameters
-                if trafo['sn_mva'] <= 0:
-                    self.issues.append(f"{trafo_name}: Invalid rating {trafo['sn_mva']} MVA")
-                if trafo['vn_hv_kv'] <= 0 or trafo['vn_lv_kv'] <= 0:
-                    self.issues.append(f"{trafo_name}: Invalid voltage ratings")
-                if trafo['vk_percent'] <= 0:
-                    self.issues.append(f"{trafo_name}: Invalid short-circuit voltage {trafo['vk_percent']}%")
+            trafo = self.net.trafo
+            names = self._element_names(trafo, 'Trafo')
+            sn = trafo['sn_mva'].to_numpy()
+            vn_hv = trafo['vn_hv_kv'].to_numpy()
+            vn_lv = trafo['vn_lv_kv'].to_numpy()
+            vk = trafo['vk_percent'].to_numpy()
+
+            for pos in np.flatnonzero(sn <= 0):
+                self.issues.append(f"{names[pos]}: Invalid rating {sn[pos]} MVA")
+            for pos in np.flatnonzero((vn_hv <= 0) | (vn_lv <= 0)):
+                self.issues.append(f"{names[pos]}: Invalid voltage ratings")
+            for pos in np.flatnonzero(vk <= 0):
+                self.issues.append(f"{names[pos]}: Invalid short-circuit voltage {vk[pos]}%")
     
-    def _test_solver_options(self):
-        """Test different solver options to improve convergence."""
-        print("\n8. SOLVER TESTING:")
-        
-        import copy
-        test_net = copy.deepcopy(self.net)
-        
-        # Test different solvers and options
+    def _test_solver_options(self, early_exit: bool = True):
+        """Test different solver options to improve convergence.
+
+        With early_exit the sweep stops at the first converging
+        configuration — enough to answer "is there a working setup", without
+        paying for the remaining power-flow runs. Pass early_exit=False to
+        enumerate every working configuration.
+        """
+        self._p("\n8. SOLVER TESTING:")
+
+        # Snapshot the net via pickle rather than deepcopy: protocol 5 moves
+        # the DataFrame-backed numpy buffers through the buffer protocol
+        # instead of recursing into every indexer object. The trials only
+        # write the res_* tables, so one copy serves every solver run
+        test_net = pickle.loads(pickle.dumps(self.net, protocol=5))
+        if not hasattr(test_net, 'ext_grid') or test_net.ext_grid.empty:
+            if hasattr(test_net, 'gen') and not test_net.gen.empty:
+                # Check if any generator is slack
+                if not any(test_net.gen['slack']):
+                    # Make first generator slack
+                    test_net.gen.loc[test_net.gen.index[0], 'slack'] = True
+            else:
+                # Add external grid to first bus
+                pp.create_ext_grid(test_net, bus=test_net.bus.index[0], vm_pu=1.0)
+
+        # Test different solvers and options, the historically most reliable
+        # Newton-Raphson setup first so a healthy net exits after one run
         solver_options = [
-            {"algorithm": "nr", "max_iteration": 10},
             {"algorithm": "nr", "max_iteration": 50},
+            {"algorithm": "nr", "max_iteration": 10},
             {"algorithm": "nr", "max_iteration": 100, "tolerance_mva": 1e-3},
             {"algorithm": "nr", "max_iteration": 100, "tolerance_mva": 1e-2},
             {"algorithm": "bfsw"},
             {"algorithm": "gs", "max_iteration": 1000},
         ]
-        
+
         successful_options = []
-        
+
         for i, options in enumerate(solver_options):
             try:
-                import copy
-                test_net = copy.deepcopy(self.net)
-                
-                # Ensure there's a slack bus
-                if not hasattr(test_net, 'ext_grid') or test_net.ext_grid.empty:
-                    if hasattr(test_net, 'gen') and not test_net.gen.empty:
-                        # Check if any generator is slack
-                        if not any(test_net.gen['slack']):
-                            # Make first generator slack
-                            test_net.gen.loc[test_net.gen.index[0], 'slack'] = True
-                    else:
-                        # Add external grid to first bus
-                        pp.create_ext_grid(test_net, bus=test_net.bus.index[0], vm_pu=1.0)
-                
-                pp.runpp(test_net, **options)
+                pp.runpp(test_net, **options, **_solver_kwargs(options))
                 successful_options.append((i, options))
-                print(f"  ✓ Option {i+1} converged: {options}")
-                
+                self._p(f"  ✓ Option {i+1} converged: {options}")
+                if early_exit:
+                    break
+
             except Exception as e:
-                print(f"  ✗ Option {i+1} failed: {options}")
-        
+                self._p(f"  ✗ Option {i+1} failed: {options}")
+
         if successful_options:
             self.info.append(f"Found {len(successful_options)} working solver configurations")
         else:
@@ -340,32 +427,34 @@ class ConvergenceDiagnostic:
     
     def _display_summary(self):
         """Display diagnostic summary."""
-        print("\n" + "="*60)
-        print("DIAGNOSTIC SUMMARY")
-        print("="*60)
+        self._p("\n" + "="*60)
+        self._p("DIAGNOSTIC SUMMARY")
+        self._p("="*60)
         
-        print(f"\n🔴 CRITICAL ISSUES ({len(self.issues)}):")
+        self._p(f"\n🔴 CRITICAL ISSUES ({len(self.issues)}):")
         for issue in self.issues:
-            print(f"  • {issue}")
+            self._p(f"  • {issue}")
         
-        print(f"\n🟡 WARNINGS ({len(self.warnings)}):")
+        self._p(f"\n🟡 WARNINGS ({len(self.warnings)}):")
         for warning in self.warnings:
-            print(f"  • {warning}")
+            self._p(f"  • {warning}")
         
-        print(f"\n🔵 INFORMATION ({len(self.info)}):")
+        self._p(f"\n🔵 INFORMATION ({len(self.info)}):")
         for info in self.info:
-            print(f"  • {info}")
+            self._p(f"  • {info}")
         
         # Recommendations
-        print(f"\n💡 RECOMMENDATIONS:")
+        self._p(f"\n💡 RECOMMENDATIONS:")
         if self.issues:
-            print("  1. Fix critical issues first - these prevent convergence")
+            self._p("  1. Fix critical issues first - these prevent convergence")
         if self.warnings:
-            print("  2. Review warnings - these may cause convergence problems")
+            self._p("  2. Review warnings - these may cause convergence problems")
         if not self.issues and not self.warnings:
-            print("  • Network appears well-configured")
-            print("  • Try increasing solver iterations or relaxing tolerance")
-            print("  • Check for numerical conditioning issues")
+            self._p("  • Network appears well-configured")
+            self._p("  • Try increasing solver iterations or relaxing tolerance")
+            self._p("  • Check for numerical conditioning issues")
+
+        self._flush_output()
 
 
 def main():
@@ -1,22 +1,197 @@
 """Simple SQLite database layer for storing grid data."""
 
+import atexit
 import sqlite3
 import json
+import pickle
+import queue
+import threading
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property
+import numpy as np
+import pandas as pd
 import pandapower as pp
-from typing import List, Tuple, Optional, Dict, Any
+from contextlib import contextmanager
+from typing import List, Tuple, Optional, Dict, Any, Iterable, Iterator
 from datetime import datetime
 
+# Hot statements defined once at module level: sqlite3 caches prepared
+# statements keyed by the exact SQL string, so reusing the same object
+# guarantees a cache hit instead of re-parsing per call
+_SQL_LOAD_GRID = "SELECT grid_data, modified_date FROM grids WHERE id = ?"
+_SQL_LOAD_GRID_BY_NAME = "SELECT grid_data, modified_date FROM grids WHERE name = ?"
+_SQL_INSERT_BUS = "INSERT INTO bus (grid_id, name, vn_kv) VALUES (?, ?, ?)"
+_SQL_INSERT_LINE = """
+    INSERT INTO line (
+        grid_id, from_bus, to_bus, length_km, r_ohm_per_km,
+        x_ohm_per_km, c_nf_per_km, max_i_ka
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_ALL_GRIDS = (
+    "SELECT id, name, description, created_date, modified_date, is_example "
+    "FROM grids ORDER BY is_example DESC, modified_date DESC"
+)
+_SQL_ANALYSIS_RESULTS = (
+    "SELECT id, analysis_type, analysis_date, results_data FROM analysis_results "
+    "WHERE grid_id = ? ORDER BY analysis_date DESC"
+)
+_SQL_ANALYSIS_RESULTS_TYPED = (
+    "SELECT id, analysis_type, analysis_date, results_data FROM analysis_results "
+    "WHERE grid_id = ? AND analysis_type = ? ORDER BY analysis_date DESC"
+)
+_SQL_BUSES = "SELECT id, name, vn_kv FROM bus WHERE grid_id = ?"
+_SQL_BUSES_LEGACY = "SELECT id, name, vn_kv FROM bus WHERE grid_id IS NULL"
+_LINE_COLUMNS = "id, from_bus, to_bus, length_km, r_ohm_per_km, x_ohm_per_km, c_nf_per_km, max_i_ka"
+_SQL_LINES = f"SELECT {_LINE_COLUMNS} FROM line WHERE grid_id = ?"
+_SQL_LINES_LEGACY = f"SELECT {_LINE_COLUMNS} FROM line WHERE grid_id IS NULL"
+
+
+@dataclass
+class AnalysisRow:
+    """One analysis_results row; the JSON payload decodes on first access."""
+
+    id: int
+    analysis_type: str
+    analysis_date: str
+    raw_results: str = field(repr=False)
+
+    @cached_property
+    def results_data(self) -> Dict[str, Any]:
+        return json.loads(self.raw_results)
+
 
 class GridDatabase:
     """Manage grid data using an SQLite database."""
 
     def __init__(self, path: str = "grid.db") -> None:
         self.path = path
-        self.conn = sqlite3.connect(self.path)
+        # A larger prepared-statement cache than the default 128 keeps every
+        # statement the layer issues compiled across the session
+        # check_same_thread=False lets the async-save worker use the writer
+        # connection; _write_lock serializes all access to it across threads
+        self.conn = sqlite3.connect(self.path, cached_statements=256, check_same_thread=False)
+        # WAL journaling with synchronous=NORMAL: writers no longer fsync the
+        # rollback journal on every commit, which dominates bulk ingestion
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # Keep temp structures and a generous page cache in memory, and map
+        # the database file so reads of the large grid_data blobs bypass the
+        # page-copy path; foreign_keys is off by default in SQLite and the
+        # schema relies on ON DELETE CASCADE
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-65536")
+        self.conn.execute("PRAGMA mmap_size=268435456")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        # Columnar views of the line table, keyed by grid_id and invalidated
+        # whenever lines are inserted or a grid is deleted
+        self._lines_soa_cache: Dict[Optional[int], Dict[str, np.ndarray]] = {}
+        # One cursor serves all queries (results are always fetched
+        # eagerly), and writes inside a transaction() block defer their
+        # commit to the block exit
+        self._cur = self.conn.cursor()
+        self._in_transaction = False
+        # Small pool of read-only connections: WAL lets them run while the
+        # writer commits, so reads never queue behind a bulk save. Filled
+        # lazily by _read_conn
+        self._ro_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=4)
+        # LRU cache of recently loaded nets as pickle blobs, keyed by
+        # (lookup kind, key) and validated against the row's modified_date;
+        # restoring from pickle skips the JSON parse on repeated loads
+        self._net_cache: "OrderedDict[Tuple[str, Any], Tuple[str, bytes]]" = OrderedDict()
+        self._net_cache_size = 8
+        self._write_lock = threading.Lock()
+        # Single-worker pool for save_grid_async, created on first use
+        self._save_pool: Optional[ThreadPoolExecutor] = None
         self._create_tables()
+        # Long-lived GUI sessions rarely close the database explicitly;
+        # make sure PRAGMA optimize still runs on clean interpreter exit
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        """Drain the pools and close every connection.
+
+        PRAGMA optimize lets SQLite refresh whatever planner statistics the
+        session's query mix showed to be stale before the file is closed.
+        Safe to call more than once.
+        """
+        if self.conn is None:
+            return
+        if self._save_pool is not None:
+            self._save_pool.shutdown(wait=True)
+            self._save_pool = None
+        while True:
+            try:
+                self._ro_pool.get_nowait().close()
+            except queue.Empty:
+                break
+        try:
+            self.conn.execute("PRAGMA optimize")
+            self.conn.commit()
+        except sqlite3.Error:
+            pass
+        self.conn.close()
+        self.conn = None
+        atexit.unregister(self.close)
+
+    def _commit(self) -> None:
+        """Commit now, unless a transaction() block will commit the batch."""
+        if not self._in_transaction:
+            self.conn.commit()
+
+    @contextmanager
+    def transaction(self):
+        """Batch several writes into a single commit.
+
+        Inside the block the write methods skip their per-call commit; the
+        whole batch commits on exit, or rolls back if the block raises.
+        """
+        self._in_transaction = True
+        try:
+            yield self
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        finally:
+            self._in_transaction = False
+
+    @contextmanager
+    def _read_conn(self):
+        """Borrow a read-only connection for a query.
+
+        Falls back to the writer connection while a transaction() block is
+        open (so pending writes stay visible) or when the database cannot be
+        opened read-only (e.g. an unusual path or filesystem).
+        """
+        # In-memory databases are private to their connection, so a second
+        # read-only handle would see an empty schema
+        if self._in_transaction or ":memory:" in self.path:
+            yield self.conn
+            return
+        try:
+            conn = self._ro_pool.get_nowait()
+        except queue.Empty:
+            try:
+                conn = sqlite3.connect(
+                    f"file:{self.path}?mode=ro", uri=True, cached_statements=256
+                )
+                conn.execute("PRAGMA mmap_size=268435456")
+            except sqlite3.Error:
+                yield self.conn
+                return
+        try:
+            yield conn
+        finally:
+            try:
+                self._ro_pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
 
     def _create_tables(self) -> None:
-        cur = self.conn.cursor()
+        cur = self._cur
         
         # Create grids table to store different grid configurations
         cur.execute(
@@ -66,6 +241,20 @@ class GridDatabase:
             """
         )
         
+        # Index the line endpoint columns: the bus foreign keys don't create
+        # covering indexes, so adjacency queries ("lines attached to bus B")
+        # would otherwise scan the whole table. Databases created before the
+        # multi-grid schema lack the grid_id columns, so only index those
+        # where they exist
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_line_from ON line(from_bus)")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_line_to ON line(to_bus)")
+        line_cols = {row[1] for row in cur.execute("PRAGMA table_info(line)")}
+        if 'grid_id' in line_cols:
+            cur.execute("CREATE INDEX IF NOT EXISTS idx_line_grid ON line(grid_id)")
+        bus_cols = {row[1] for row in cur.execute("PRAGMA table_info(bus)")}
+        if 'grid_id' in bus_cols:
+            cur.execute("CREATE INDEX IF NOT EXISTS idx_bus_grid ON bus(grid_id)")
+
         # Create analysis_results table to store contingency analysis results
         cur.execute(
             """
@@ -79,55 +268,115 @@ class GridDatabase:
             )
             """
         )
-        
-        self.conn.commit()
+
+        # get_analysis_results filters on grid_id (optionally analysis_type)
+        # and orders by analysis_date DESC; these composite indexes satisfy
+        # both the filter and the sort, so no scan-and-sort step remains
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_ar_grid_date ON analysis_results(grid_id, analysis_date)"
+        )
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_ar_grid_type_date ON analysis_results(grid_id, analysis_type, analysis_date)"
+        )
+
+        self._commit()
 
     def save_grid(self, name: str, net: pp.pandapowerNet, description: str = "", is_example: bool = False) -> int:
         """Save a pandapower network to the database."""
-        cur = self.conn.cursor()
-        
-        # Convert pandapower network to JSON
-        grid_data = pp.to_json(net)
+        # Convert pandapower network to JSON and compress it; the pandapower
+        # JSON is highly repetitive, so zlib typically shrinks it several-fold,
+        # cutting both the database size and the bytes pushed through I/O.
+        # Serialization runs outside the lock so concurrent async saves only
+        # serialize on the actual write
+        grid_data = zlib.compress(pp.to_json(net).encode("utf-8"))
         current_time = datetime.now().isoformat()
+        with self._write_lock:
+            return self._write_grid_row(name, description, current_time, grid_data, is_example)
+
+    def _write_grid_row(self, name: str, description: str, current_time: str,
+                        grid_data: bytes, is_example: bool) -> int:
+        cur = self._cur
         
-        try:
-            cur.execute(
-                """
-                INSERT INTO grids (name, description, created_date, modified_date, grid_data, is_example)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (name, description, current_time, current_time, grid_data, is_example)
-            )
-            self.conn.commit()
-            return cur.lastrowid
-        except sqlite3.IntegrityError:
-            # Grid name already exists, update it
-            cur.execute(
-                """
-                UPDATE grids SET description = ?, modified_date = ?, grid_data = ?, is_example = ?
-                WHERE name = ?
-                """,
-                (description, current_time, grid_data, is_example, name)
-            )
-            self.conn.commit()
-            cur.execute("SELECT id FROM grids WHERE name = ?", (name,))
-            return cur.fetchone()[0]
+        # One upsert replaces the old insert/catch-IntegrityError/update/
+        # re-select dance; RETURNING hands back the row id for both the
+        # insert and the conflict-update path
+        cur.execute(
+            """
+            INSERT INTO grids (name, description, created_date, modified_date, grid_data, is_example)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET
+                description = excluded.description,
+                modified_date = excluded.modified_date,
+                grid_data = excluded.grid_data,
+                is_example = excluded.is_example
+            RETURNING id
+            """,
+            (name, description, current_time, current_time, grid_data, is_example)
+        )
+        grid_id = cur.fetchone()[0]
+        self._commit()
+        self._net_cache.pop(("id", grid_id), None)
+        self._net_cache.pop(("name", name), None)
+        return grid_id
+
+    def save_grid_async(self, name: str, net: pp.pandapowerNet, description: str = "",
+                        is_example: bool = False) -> "Future[int]":
+        """Save a grid on a background thread and return a Future of its id.
+
+        The net is snapshotted before this returns, so the caller may keep
+        mutating it; the expensive JSON serialization and the commit happen
+        on the worker. Saves are queued on a single worker, so they apply
+        in submission order.
+        """
+        if self._save_pool is None:
+            self._save_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="grid-save")
+        snapshot = pickle.loads(pickle.dumps(net, protocol=5))
+        return self._save_pool.submit(self.save_grid, name, snapshot, description, is_example)
+
+    @staticmethod
+    def _decode_grid_data(raw) -> str:
+        """Return the stored grid JSON, decompressing where needed.
+
+        New rows hold zlib-compressed bytes; rows written before the
+        compression change hold plain JSON text and pass through untouched.
+        """
+        if isinstance(raw, bytes):
+            return zlib.decompress(raw).decode("utf-8")
+        return raw
+
+    def _deserialize_grid(self, cache_key: Tuple[str, Any], raw, modified_date: str) -> pp.pandapowerNet:
+        """Turn a grids row into a net, serving repeats from the LRU cache.
+
+        Cache entries hold a pickle blob validated against the row's
+        modified_date; unpickling is far cheaper than re-parsing the
+        pandapower JSON, and each call gets a fresh object the caller may
+        mutate freely.
+        """
+        cached = self._net_cache.get(cache_key)
+        if cached is not None and cached[0] == modified_date:
+            self._net_cache.move_to_end(cache_key)
+            return pickle.loads(cached[1])
+        net = pp.from_json_string(self._decode_grid_data(raw))
+        self._net_cache[cache_key] = (modified_date, pickle.dumps(net, protocol=5))
+        self._net_cache.move_to_end(cache_key)
+        while len(self._net_cache) > self._net_cache_size:
+            self._net_cache.popitem(last=False)
+        return net
 
     def load_grid(self, grid_id: int) -> Optional[pp.pandapowerNet]:
         """Load a pandapower network from the database."""
-        cur = self.conn.cursor()
-        cur.execute("SELECT grid_data FROM grids WHERE id = ?", (grid_id,))
-        result = cur.fetchone()
-        
+        with self._read_conn() as conn:
+            result = conn.execute(_SQL_LOAD_GRID, (grid_id,)).fetchone()
+
         if result:
             try:
-                grid_data = result[0]
-                net = pp.from_json_string(grid_data)
-                
-                # Validate the loaded network
-                if not hasattr(net, 'bus') or len(net.bus) == 0:
+                net = self._deserialize_grid(("id", grid_id), result[0], result[1])
+
+                # Validate the loaded network; a deserialized net always
+                # carries a bus table, so the shape check alone suffices
+                if net.bus.shape[0] == 0:
                     raise ValueError("Loaded network has no buses")
-                
+
                 return net
             except Exception as e:
                 print(f"Error loading grid {grid_id}: {e}")
@@ -136,19 +385,18 @@ class GridDatabase:
 
     def load_grid_by_name(self, name: str) -> Optional[pp.pandapowerNet]:
         """Load a pandapower network by name from the database."""
-        cur = self.conn.cursor()
-        cur.execute("SELECT grid_data FROM grids WHERE name = ?", (name,))
-        result = cur.fetchone()
+        with self._read_conn() as conn:
+            result = conn.execute(_SQL_LOAD_GRID_BY_NAME, (name,)).fetchone()
         
         if result:
             try:
-                grid_data = result[0]
-                net = pp.from_json_string(grid_data)
-                
-                # Validate the loaded network
-                if not hasattr(net, 'bus') or len(net.bus) == 0:
+                net = self._deserialize_grid(("name", name), result[0], result[1])
+
+                # Validate the loaded network; a deserialized net always
+                # carries a bus table, so the shape check alone suffices
+                if net.bus.shape[0] == 0:
                     raise ValueError("Loaded network has no buses")
-                
+
                 return net
             except Exception as e:
                 print(f"Error loading grid '{name}': {e}")
@@ -157,22 +405,21 @@ class GridDatabase:
 
     def get_all_grids(self) -> List[Tuple[int, str, str, str, str, bool]]:
         """Get list of all saved grids."""
-        cur = self.conn.cursor()
-        cur.execute(
-            "SELECT id, name, description, created_date, modified_date, is_example FROM grids ORDER BY is_example DESC, modified_date DESC"
-        )
-        return cur.fetchall()
+        with self._read_conn() as conn:
+            return conn.execute(_SQL_ALL_GRIDS).fetchall()
 
     def delete_grid(self, grid_id: int) -> bool:
         """Delete a grid and all associated data."""
-        cur = self.conn.cursor()
+        cur = self._cur
         cur.execute("DELETE FROM grids WHERE id = ?", (grid_id,))
-        self.conn.commit()
+        self._commit()
+        self._lines_soa_cache.clear()
+        self._net_cache.pop(("id", grid_id), None)
         return cur.rowcount > 0
 
     def save_analysis_results(self, grid_id: int, analysis_type: str, results_data: Dict[str, Any]) -> int:
         """Save contingency analysis results."""
-        cur = self.conn.cursor()
+        cur = self._cur
         analysis_date = datetime.now().isoformat()
         results_json = json.dumps(results_data)
         
@@ -183,93 +430,143 @@ class GridDatabase:
             """,
             (grid_id, analysis_type, analysis_date, results_json)
         )
-        self.conn.commit()
+        self._commit()
         return cur.lastrowid
 
+    def save_analysis_results_bulk(self, grid_id: int, analysis_type: str,
+                                   results_list: Iterable[Dict[str, Any]]) -> List[int]:
+        """Save several analysis results in one executemany and one commit.
+
+        All rows share the same grid, type and timestamp; returns their new
+        ids in insertion order.
+        """
+        analysis_date = datetime.now().isoformat()
+        params = [(grid_id, analysis_type, analysis_date, json.dumps(r)) for r in results_list]
+        if not params:
+            return []
+        cur = self._cur
+        cur.executemany(
+            """
+            INSERT INTO analysis_results (grid_id, analysis_type, analysis_date, results_data)
+            VALUES (?, ?, ?, ?)
+            """,
+            params,
+        )
+        self._commit()
+        last = cur.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return list(range(last - len(params) + 1, last + 1))
+
     def get_analysis_results(self, grid_id: int, analysis_type: str = None) -> List[Tuple[int, str, str, Dict[str, Any]]]:
         """Get analysis results for a grid."""
-        cur = self.conn.cursor()
-        if analysis_type:
-            cur.execute(
-                "SELECT id, analysis_type, analysis_date, results_data FROM analysis_results WHERE grid_id = ? AND analysis_type = ? ORDER BY analysis_date DESC",
-                (grid_id, analysis_type)
-            )
-        else:
-            cur.execute(
-                "SELECT id, analysis_type, analysis_date, results_data FROM analysis_results WHERE grid_id = ? ORDER BY analysis_date DESC",
-                (grid_id,)
-            )
-        
+        with self._read_conn() as conn:
+            if analysis_type:
+                rows = conn.execute(_SQL_ANALYSIS_RESULTS_TYPED, (grid_id, analysis_type)).fetchall()
+            else:
+                rows = conn.execute(_SQL_ANALYSIS_RESULTS, (grid_id,)).fetchall()
+
         results = []
-        for row in cur.fetchall():
+        for row in rows:
             results.append((row[0], row[1], row[2], json.loads(row[3])))
         return results
 
+    def iter_analysis_results(self, grid_id: int, analysis_type: str = None) -> Iterator[AnalysisRow]:
+        """Yield analysis rows newest-first, decoding payloads lazily.
+
+        Unlike get_analysis_results, rows stream off the cursor one at a
+        time and the JSON blob is only parsed when a row's results_data is
+        actually read, so scanning ids/types/dates over a long history
+        never materializes the payloads.
+        """
+        with self._read_conn() as conn:
+            if analysis_type:
+                rows = conn.execute(_SQL_ANALYSIS_RESULTS_TYPED, (grid_id, analysis_type))
+            else:
+                rows = conn.execute(_SQL_ANALYSIS_RESULTS, (grid_id,))
+            for row in rows:
+                yield AnalysisRow(row[0], row[1], row[2], row[3])
+
     def update_grid_description(self, grid_id: int, description: str) -> bool:
         """Update grid description."""
-        cur = self.conn.cursor()
+        cur = self._cur
         modified_date = datetime.now().isoformat()
         cur.execute(
             "UPDATE grids SET description = ?, modified_date = ? WHERE id = ?",
             (description, modified_date, grid_id)
         )
-        self.conn.commit()
+        self._commit()
         return cur.rowcount > 0
 
     def initialize_example_grids(self):
         """Initialize the database with example grids if they don't exist."""
+        # user_version records that seeding already completed, so repeat
+        # calls (every GUI/CLI start against an existing file) skip the
+        # probe query and the examples import entirely
+        if self._cur.execute("PRAGMA user_version").fetchone()[0] >= 1:
+            return
+
         from examples import create_example_grid, create_ieee_9_bus, create_ieee_39_bus, create_ieee_39_bus_standard
-        
-        # Check if example grids already exist
-        cur = self.conn.cursor()
-        
-        # Check for each specific example to avoid duplicates
-        example_names = [
-            "Simple Example Grid",
-            "IEEE 9-Bus Test System", 
-            "IEEE 39-Bus New England System",
-            "IEEE 39-Bus Standard (MATPOWER)"
-        ]
-        
-        # Add example grids if they don't exist
+
+        # Name -> (factory, description) for every shipped example grid
+        examples = {
+            "Simple Example Grid": (
+                create_example_grid,
+                "Basic 2-bus system with generator and load"),
+            "IEEE 9-Bus Test System": (
+                create_ieee_9_bus,
+                "Standard IEEE 9-bus reliability test system"),
+            "IEEE 39-Bus New England System": (
+                create_ieee_39_bus,
+                "IEEE 39-bus New England test system for large-scale analysis"),
+            "IEEE 39-Bus Standard (MATPOWER)": (
+                create_ieee_39_bus_standard,
+                "Standard IEEE 39-bus system based on MATPOWER case39"),
+        }
+
+        # One IN query replaces the per-name COUNT(*) probes; only the
+        # missing examples are then built and saved. The transaction()
+        # block turns the individual save_grid commits into one commit
+        # (and one fsync) for the whole batch
         try:
-            # Simple example grid
-            cur.execute("SELECT COUNT(*) FROM grids WHERE name = ? AND is_example = 1", ("Simple Example Grid",))
-            if cur.fetchone()[0] == 0:
-                example_net = create_example_grid()
-                self.save_grid("Simple Example Grid", example_net, 
-                              "Basic 2-bus system with generator and load", True)
-            
-            # IEEE 9-bus system
-            cur.execute("SELECT COUNT(*) FROM grids WHERE name = ? AND is_example = 1", ("IEEE 9-Bus Test System",))
-            if cur.fetchone()[0] == 0:
-                ieee9_net = create_ieee_9_bus()
-                self.save_grid("IEEE 9-Bus Test System", ieee9_net,
-                              "Standard IEEE 9-bus reliability test system", True)
-            
-            # IEEE 39-bus system  
-            cur.execute("SELECT COUNT(*) FROM grids WHERE name = ? AND is_example = 1", ("IEEE 39-Bus New England System",))
-            if cur.fetchone()[0] == 0:
-                ieee39_net = create_ieee_39_bus()
-                self.save_grid("IEEE 39-Bus New England System", ieee39_net,
-                              "IEEE 39-bus New England test system for large-scale analysis", True)
-            
-            # IEEE 39-bus standard system
-            cur.execute("SELECT COUNT(*) FROM grids WHERE name = ? AND is_example = 1", ("IEEE 39-Bus Standard (MATPOWER)",))
-            if cur.fetchone()[0] == 0:
-                ieee39std_net = create_ieee_39_bus_standard()
-                self.save_grid("IEEE 39-Bus Standard (MATPOWER)", ieee39std_net,
-                              "Standard IEEE 39-bus system based on MATPOWER case39", True)
-                          
+            placeholders = ", ".join("?" * len(examples))
+            existing = {
+                row[0] for row in self._cur.execute(
+                    f"SELECT name FROM grids WHERE is_example = 1 AND name IN ({placeholders})",
+                    tuple(examples),
+                )
+            }
+            missing = [name for name in examples if name not in existing]
+            with self.transaction():
+                for name in missing:
+                    factory, description = examples[name]
+                    self.save_grid(name, factory(), description, True)
+            if missing:
+                # Seeding is the one bulk write a fresh database sees;
+                # refresh the planner statistics while the data is hot
+                self._cur.execute("ANALYZE")
+            self._cur.execute("PRAGMA user_version = 1")
+            self._commit()
+
         except Exception as e:
             print(f"Warning: Could not initialize example grids: {e}")
 
     # Legacy methods for backward compatibility
     def add_bus(self, name: str, vn_kv: float, grid_id: int = None) -> int:
-        cur = self.conn.cursor()
-        cur.execute("INSERT INTO bus (grid_id, name, vn_kv) VALUES (?, ?, ?)", (grid_id, name, vn_kv))
-        self.conn.commit()
-        return cur.lastrowid
+        return self.add_buses([(name, vn_kv)], grid_id=grid_id)[-1]
+
+    def add_buses(self, rows: Iterable[Tuple[str, float]], grid_id: int = None) -> List[int]:
+        """Insert many buses in one transaction and return their new ids.
+
+        rows are (name, vn_kv) tuples. A single executemany plus one commit
+        amortizes the per-commit fsync over the whole batch.
+        """
+        params = [(grid_id, name, vn_kv) for name, vn_kv in rows]
+        if not params:
+            return []
+        cur = self._cur
+        cur.executemany(_SQL_INSERT_BUS, params)
+        self._commit()
+        last = cur.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return list(range(last - len(params) + 1, last + 1))
 
     def add_line(
         self,
@@ -282,45 +579,80 @@ class GridDatabase:
         max_i_ka: float,
         grid_id: int = None,
     ) -> int:
-        cur = self.conn.cursor()
-        cur.execute(
-            """
-            INSERT INTO line (
-                grid_id, from_bus, to_bus, length_km, r_ohm_per_km,
-                x_ohm_per_km, c_nf_per_km, max_i_ka
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                grid_id,
-                from_bus,
-                to_bus,
-                length_km,
-                r_ohm_per_km,
-                x_ohm_per_km,
-                c_nf_per_km,
-                max_i_ka,
-            ),
-        )
-        self.conn.commit()
-        return cur.lastrowid
+        return self.add_lines(
+            [(from_bus, to_bus, length_km, r_ohm_per_km, x_ohm_per_km, c_nf_per_km, max_i_ka)],
+            grid_id=grid_id,
+        )[-1]
+
+    def add_lines(
+        self,
+        rows: Iterable[Tuple[int, int, float, float, float, float, float]],
+        grid_id: int = None,
+    ) -> List[int]:
+        """Insert many lines in one transaction and return their new ids.
+
+        rows are (from_bus, to_bus, length_km, r_ohm_per_km, x_ohm_per_km,
+        c_nf_per_km, max_i_ka) tuples.
+        """
+        params = [(grid_id,) + tuple(row) for row in rows]
+        if not params:
+            return []
+        cur = self._cur
+        cur.executemany(_SQL_INSERT_LINE, params)
+        self._commit()
+        self._lines_soa_cache.clear()
+        last = cur.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return list(range(last - len(params) + 1, last + 1))
 
     def get_buses(self, grid_id: int = None) -> List[Tuple[int, str, float]]:
-        cur = self.conn.cursor()
+        with self._read_conn() as conn:
+            if grid_id:
+                return conn.execute(_SQL_BUSES, (grid_id,)).fetchall()
+            return conn.execute(_SQL_BUSES_LEGACY).fetchall()
+
+    def get_buses_df(self, grid_id: int = None) -> pd.DataFrame:
+        """Fetch the bus table as a DataFrame with columnar numeric arrays."""
         if grid_id:
-            cur.execute("SELECT id, name, vn_kv FROM bus WHERE grid_id = ?", (grid_id,))
-        else:
-            cur.execute("SELECT id, name, vn_kv FROM bus WHERE grid_id IS NULL")
-        return cur.fetchall()
+            return pd.read_sql_query(_SQL_BUSES, self.conn, params=(grid_id,))
+        return pd.read_sql_query(_SQL_BUSES_LEGACY, self.conn)
 
-    def get_lines(self, grid_id: int = None) -> List[Tuple[int, int, int, float, float, float, float, float]]:
-        cur = self.conn.cursor()
+    def get_lines_df(self, grid_id: int = None) -> pd.DataFrame:
+        """Fetch the line table as a DataFrame with columnar numeric arrays.
+
+        Unlike get_lines, the numeric columns come back as ndarrays ready for
+        vectorized math or batch insertion into a pandapower net, without the
+        list-of-Python-tuples intermediate.
+        """
         if grid_id:
-            cur.execute(
-                "SELECT id, from_bus, to_bus, length_km, r_ohm_per_km, x_ohm_per_km, c_nf_per_km, max_i_ka FROM line WHERE grid_id = ?",
-                (grid_id,)
-            )
-        else:
-            cur.execute(
-                "SELECT id, from_bus, to_bus, length_km, r_ohm_per_km, x_ohm_per_km, c_nf_per_km, max_i_ka FROM line WHERE grid_id IS NULL"
-            )
-        return cur.fetchall()
+            return pd.read_sql_query(_SQL_LINES, self.conn, params=(grid_id,))
+        return pd.read_sql_query(_SQL_LINES_LEGACY, self.conn)
+
+    def get_lines_soa(self, grid_id: int = None) -> Dict[str, np.ndarray]:
+        """Columnar (structure-of-arrays) view of the line table.
+
+        Cached until the next line insert or grid deletion, so repeated
+        consumers share one set of arrays; the integer id/bus columns and
+        float parameter columns come back ready for vectorized math.
+        """
+        cached = self._lines_soa_cache.get(grid_id)
+        if cached is None:
+            rows = self.get_lines(grid_id)
+            cols = np.asarray(rows, dtype=float).T if rows else np.empty((8, 0))
+            cached = {
+                'id': cols[0].astype(int),
+                'from_bus': cols[1].astype(int),
+                'to_bus': cols[2].astype(int),
+                'length_km': cols[3],
+                'r_ohm_per_km': cols[4],
+                'x_ohm_per_km': cols[5],
+                'c_nf_per_km': cols[6],
+                'max_i_ka': cols[7],
+            }
+            self._lines_soa_cache[grid_id] = cached
+        return cached
+
+    def get_lines(self, grid_id: int = None) -> List[Tuple[int, int, int, float, float, float, float, float]]:
+        with self._read_conn() as conn:
+            if grid_id:
+                return conn.execute(_SQL_LINES, (grid_id,)).fetchall()
+            return conn.execute(_SQL_LINES_LEGACY).fetchall()
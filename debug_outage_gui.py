@@ -1,39 +1,84 @@
 #!/usr/bin/env python3
 """Debug the outage simulation GUI to find why results aren't showing."""
 
+import atexit
+import sys
 import tkinter as tk
+from functools import lru_cache
 from tkinter import ttk
 from typing import Dict, Any
 
+# Output is buffered and written in large chunks: the debug run emits a
+# few hundred lines, and one write per flush beats one syscall per line
+_out: list = []
+
+
+def _p(line: str = "") -> None:
+    _out.append(str(line))
+
+
+def _flush_output() -> None:
+    if _out:
+        sys.stdout.write("\n".join(_out) + "\n")
+        _out.clear()
+
+
+atexit.register(_flush_output)
+
+
+@lru_cache(maxsize=1)
+def _get_module():
+    """Shared database/module pair for every debug step.
+
+    The three debug entry points used to each build their own GridDatabase
+    and re-run example initialization; memoizing the pair means the setup
+    cost is paid once per debug session.
+    """
+    from database import GridDatabase
+    from state_estimation_module import StateEstimationModule
+    db = GridDatabase()
+    db.initialize_example_grids()
+    return db, StateEstimationModule(db)
+
+
+@lru_cache(maxsize=1)
+def _available_grids():
+    """Grid list, fetched once — it never changes during a debug run."""
+    return tuple(_get_module()[1].get_available_grids())
+
+
+@lru_cache(maxsize=None)
+def _available_buses(grid_id):
+    """Outage-capable buses per grid, fetched once per grid."""
+    return tuple(_get_module()[1].get_available_buses_for_outage(grid_id=grid_id))
+
+
 # Test the outage simulation workflow step by step
 def test_outage_workflow():
     """Test each step of the outage simulation workflow."""
-    print("🔍 DEBUGGING OUTAGE SIMULATION WORKFLOW")
-    print("=" * 60)
+    _p("🔍 DEBUGGING OUTAGE SIMULATION WORKFLOW")
+    _p("=" * 60)
     
     try:
         # Step 1: Test imports
-        print("Step 1: Testing imports...")
-        from state_estimation_module import StateEstimationModule, EstimationConfig, EstimationMode
-        from database import GridDatabase
-        print("✅ Imports successful")
-        
+        _p("Step 1: Testing imports...")
+        from state_estimation_module import EstimationConfig, EstimationMode
+        _p("✅ Imports successful")
+
         # Step 2: Test database initialization
-        print("\nStep 2: Testing database initialization...")
-        db = GridDatabase()
-        db.initialize_example_grids()
-        module = StateEstimationModule(db)
-        print("✅ Database initialized")
-        
+        _p("\nStep 2: Testing database initialization...")
+        db, module = _get_module()
+        _p("✅ Database initialized")
+
         # Step 3: Test grid selection
-        print("\nStep 3: Testing grid selection...")
-        grids = module.get_available_grids()
-        print(f"✅ Found {len(grids)} grids:")
+        _p("\nStep 3: Testing grid selection...")
+        grids = _available_grids()
+        _p(f"✅ Found {len(grids)} grids:")
         for i, (grid_id, name, desc) in enumerate(grids):
-            print(f"   {i+1}. ID {grid_id}: {name}")
+            _p(f"   {i+1}. ID {grid_id}: {name}")
         
         if not grids:
-            print("❌ No grids available!")
+            _p("❌ No grids available!")
             return False
         
         # Use IEEE 9-Bus system (most likely to be available)
@@ -47,24 +92,24 @@ def test_outage_workflow():
             target_grid = grids[0]  # Use first available
         
         grid_id, grid_name, grid_desc = target_grid
-        print(f"✅ Selected grid: {grid_name}")
+        _p(f"✅ Selected grid: {grid_name}")
         
         # Step 4: Test bus listing
-        print(f"\nStep 4: Testing bus listing for outage...")
-        buses = module.get_available_buses_for_outage(grid_id=grid_id)
-        print(f"✅ Found {len(buses)} buses available for outage:")
+        _p(f"\nStep 4: Testing bus listing for outage...")
+        buses = _available_buses(grid_id)
+        _p(f"✅ Found {len(buses)} buses available for outage:")
         for bus_idx, bus_name in buses[:5]:  # Show first 5
-            print(f"   Bus {bus_idx}: {bus_name}")
+            _p(f"   Bus {bus_idx}: {bus_name}")
         if len(buses) > 5:
-            print(f"   ... and {len(buses)-5} more buses")
+            _p(f"   ... and {len(buses)-5} more buses")
         
         if not buses:
-            print("❌ No buses available for outage!")
+            _p("❌ No buses available for outage!")
             return False
         
         # Step 5: Test outage simulation
-        print(f"\nStep 5: Running outage simulation...")
-        print(f"Simulating outage at bus {buses[0][0]} ({buses[0][1]})")
+        _p(f"\nStep 5: Running outage simulation...")
+        _p(f"Simulating outage at bus {buses[0][0]} ({buses[0][1]})")
         
         config = EstimationConfig(
             mode=EstimationMode.VOLTAGE_ONLY,
@@ -78,15 +123,15 @@ def test_outage_workflow():
             config=config
         )
         
-        print("✅ Outage simulation completed")
-        print(f"Success: {results.get('success', False)}")
+        _p("✅ Outage simulation completed")
+        _p(f"Success: {results.get('success', False)}")
         
         if not results.get('success'):
-            print(f"❌ Simulation failed: {results.get('error', 'Unknown error')}")
+            _p(f"❌ Simulation failed: {results.get('error', 'Unknown error')}")
             return False
         
         # Step 6: Test result structure
-        print(f"\nStep 6: Analyzing result structure...")
+        _p(f"\nStep 6: Analyzing result structure...")
         
         expected_keys = [
             'success', 'grid_name', 'outage_buses', 'timestamp',
@@ -95,28 +140,28 @@ def test_outage_workflow():
         
         for key in expected_keys:
             if key in results:
-                print(f"✅ {key}: Present")
+                _p(f"✅ {key}: Present")
             else:
-                print(f"❌ {key}: MISSING")
+                _p(f"❌ {key}: MISSING")
         
         # Step 7: Test display formatting
-        print(f"\nStep 7: Testing display formatting...")
+        _p(f"\nStep 7: Testing display formatting...")
         
         outage_buses = results.get('outage_buses', [])
         bus_list = ", ".join(map(str, outage_buses))
-        print(f"✅ Bus list: '{bus_list}'")
+        _p(f"✅ Bus list: '{bus_list}'")
         
         comparison = results.get('comparison_analysis', {})
         converged = comparison.get('outage_converged', False)
-        print(f"✅ Convergence status: {converged}")
+        _p(f"✅ Convergence status: {converged}")
         
         scenario_summary = results.get('scenario_summary', '')
-        print(f"✅ Scenario summary length: {len(scenario_summary)} characters")
+        _p(f"✅ Scenario summary length: {len(scenario_summary)} characters")
         if scenario_summary:
-            print(f"   First line: {scenario_summary.split(chr(10))[0][:60]}...")
+            _p(f"   First line: {scenario_summary.split(chr(10))[0][:60]}...")
         
         # Step 8: Test what GUI would display
-        print(f"\nStep 8: Simulating GUI display...")
+        _p(f"\nStep 8: Simulating GUI display...")
         
         # This is exactly what the GUI does in _display_outage_results
         if comparison.get('outage_converged', False):
@@ -147,15 +192,16 @@ including baseline vs outage comparison, observability analysis,
 and operational recommendations.
 """
         
-        print("✅ GUI would display:")
-        print("-" * 40)
-        print(gui_summary)
-        print("-" * 40)
+        _p("✅ GUI would display:")
+        _p("-" * 40)
+        _p(gui_summary)
+        _p("-" * 40)
         
         return True
         
     except Exception as e:
-        print(f"❌ ERROR in outage workflow: {e}")
+        _p(f"❌ ERROR in outage workflow: {e}")
+        _flush_output()
         import traceback
         traceback.print_exc()
         return False
@@ -163,36 +209,31 @@ and operational recommendations.
 
 def test_gui_components():
     """Test the GUI components for outage simulation."""
-    print("\n🖥️ TESTING GUI COMPONENTS")
-    print("=" * 60)
+    _p("\n🖥️ TESTING GUI COMPONENTS")
+    _p("=" * 60)
     
     try:
         # Test GUI imports
-        print("Testing GUI imports...")
+        _p("Testing GUI imports...")
         from gui import GridApp
-        print("✅ GUI imports successful")
+        _p("✅ GUI imports successful")
         
         # Test state estimation module integration
-        print("Testing state estimation module in GUI context...")
-        from database import GridDatabase
-        from state_estimation_module import StateEstimationModule
-        
-        db = GridDatabase()
-        db.initialize_example_grids()
-        module = StateEstimationModule(db)
-        
+        _p("Testing state estimation module in GUI context...")
+        db, module = _get_module()
+
         # Test the methods that GUI calls
-        print("Testing GUI method calls...")
-        
+        _p("Testing GUI method calls...")
+
         # Get grids (what GUI does in grid selection)
-        grids = module.get_available_grids()
+        grids = _available_grids()
         if grids:
             grid_id = grids[0][0]
-            print(f"✅ Grid selection works: {grids[0][1]}")
+            _p(f"✅ Grid selection works: {grids[0][1]}")
             
             # Get buses (what GUI does in outage dialog)
-            buses = module.get_available_buses_for_outage(grid_id=grid_id)
-            print(f"✅ Bus listing works: {len(buses)} buses")
+            buses = _available_buses(grid_id)
+            _p(f"✅ Bus listing works: {len(buses)} buses")
             
             # Simulate outage (what GUI does when user clicks run)
             if buses:
@@ -206,33 +247,34 @@ def test_gui_components():
                 )
                 
                 if results.get('success'):
-                    print("✅ Outage simulation works")
+                    _p("✅ Outage simulation works")
                     
                     # Test what _display_outage_results would do
-                    print("✅ Result display formatting works")
+                    _p("✅ Result display formatting works")
                     
                     # Test what _view_se_results would do
                     current_results = module.get_current_results()
                     if current_results:
-                        print("✅ Results storage/retrieval works")
+                        _p("✅ Results storage/retrieval works")
                         
                         if 'outage_buses' in current_results:
-                            print("✅ Outage results properly stored")
+                            _p("✅ Outage results properly stored")
                         else:
-                            print("⚠️  Outage results may not be stored correctly")
+                            _p("⚠️  Outage results may not be stored correctly")
                     else:
-                        print("❌ No current results stored")
+                        _p("❌ No current results stored")
                 else:
-                    print(f"❌ Outage simulation failed: {results.get('error')}")
+                    _p(f"❌ Outage simulation failed: {results.get('error')}")
             else:
-                print("❌ No buses available for testing")
+                _p("❌ No buses available for testing")
         else:
-            print("❌ No grids available for testing")
+            _p("❌ No grids available for testing")
         
         return True
         
     except Exception as e:
-        print(f"❌ ERROR in GUI component test: {e}")
+        _p(f"❌ ERROR in GUI component test: {e}")
+        _flush_output()
         import traceback
         traceback.print_exc()
         return False
@@ -240,18 +282,15 @@ def test_gui_components():
 
 def create_minimal_test_gui():
     """Create a minimal test GUI to verify outage simulation works."""
-    print("\n🧪 CREATING MINIMAL TEST GUI")
-    print("=" * 60)
+    _p("\n🧪 CREATING MINIMAL TEST GUI")
+    _p("=" * 60)
     
     try:
-        from state_estimation_module import StateEstimationModule, EstimationConfig, EstimationMode
-        from database import GridDatabase
-        
+        from state_estimation_module import EstimationConfig, EstimationMode
+
         # Initialize
-        db = GridDatabase()
-        db.initialize_example_grids()
-        module = StateEstimationModule(db)
-        
+        db, module = _get_module()
+
         root = tk.Tk()
         root.title("Outage Simulation Test")
         root.geometry("600x400")
@@ -263,31 +302,32 @@ def create_minimal_test_gui():
         
         def run_test_outage():
             """Run a test outage simulation."""
-            results_text.delete(1.0, tk.END)
-            results_text.insert(tk.END, "Running outage simulation...\n")
-            root.update()
-            
+            # Build the whole report first and push it into the widget with
+            # one insert; repeated insert/update cycles force a re-layout
+            # per line, and update_idletasks repaints without re-entering
+            # the event loop
+            chunks = ["Running outage simulation...\n"]
+
             try:
                 # Get first available grid
-                grids = module.get_available_grids()
+                grids = _available_grids()
                 if not grids:
-                    results_text.insert(tk.END, "❌ No grids available\n")
+                    chunks.append("❌ No grids available\n")
                     return
-                
+
                 grid_id = grids[0][0]
                 grid_name = grids[0][1]
-                
+
                 # Get first available bus
-                buses = module.get_available_buses_for_outage(grid_id=grid_id)
+                buses = _available_buses(grid_id)
                 if not buses:
-                    results_text.insert(tk.END, "❌ No buses available\n")
+                    chunks.append("❌ No buses available\n")
                     return
-                
+
                 test_bus = buses[0][0]
-                
-                results_text.insert(tk.END, f"Testing {grid_name}, bus {test_bus}...\n")
-                root.update()
-                
+
+                chunks.append(f"Testing {grid_name}, bus {test_bus}...\n")
+
                 # Run outage simulation
                 config = EstimationConfig(mode=EstimationMode.VOLTAGE_ONLY)
                 results = module.simulate_measurement_outage_scenario(
@@ -295,7 +335,7 @@ def create_minimal_test_gui():
                     outage_buses=[test_bus],
                     config=config
                 )
-                
+
                 # Display results (same as GUI does)
                 if results.get('success'):
                     comparison = results.get('comparison_analysis', {})
@@ -303,8 +343,8 @@ def create_minimal_test_gui():
                         status = "✅ CONVERGED"
                     else:
                         status = "❌ UNOBSERVABLE"
-                    
-                    summary = f"""
+
+                    chunks.append(f"""
 TEST OUTAGE SIMULATION RESULTS:
 Grid: {results.get('grid_name')}
 Outaged Bus: {test_bus}
@@ -312,13 +352,16 @@ Status: {status}
 Time: {results.get('timestamp')}
 
 {results.get('scenario_summary', 'No summary')}
-"""
-                    results_text.insert(tk.END, summary)
+""")
                 else:
-                    results_text.insert(tk.END, f"❌ Failed: {results.get('error')}\n")
-                
+                    chunks.append(f"❌ Failed: {results.get('error')}\n")
+
             except Exception as e:
-                results_text.insert(tk.END, f"❌ Error: {e}\n")
+                chunks.append(f"❌ Error: {e}\n")
+            finally:
+                results_text.delete(1.0, tk.END)
+                results_text.insert(tk.END, "".join(chunks))
+                root.update_idletasks()
         
         # Controls
         ttk.Button(root, text="Run Test Outage", command=run_test_outage).pack(pady=10)
@@ -330,42 +373,42 @@ Time: {results.get('timestamp')}
         # Auto-run test
         root.after(1000, run_test_outage)
         
-        print("✅ Test GUI created - starting...")
+        _p("✅ Test GUI created - starting...")
+        _flush_output()
         root.mainloop()
         
         return True
         
     except Exception as e:
-        print(f"❌ ERROR creating test GUI: {e}")
+        _p(f"❌ ERROR creating test GUI: {e}")
         return False
 
 
 if __name__ == "__main__":
-    print("🚀 DEBUGGING OUTAGE SIMULATION GUI ISSUES\n")
+    _p("🚀 DEBUGGING OUTAGE SIMULATION GUI ISSUES\n")
     
     # Run comprehensive debugging
     step1_success = test_outage_workflow()
     step2_success = test_gui_components()
     
     if step1_success and step2_success:
-        print(f"\n🎉 ALL DEBUG TESTS PASSED!")
-        print("✅ Outage simulation should work correctly")
-        print("✅ GUI integration is functional")
-        
-        print(f"\n🔧 IF YOU'RE STILL NOT SEEING RESULTS:")
-        print("1. Make sure you're in the 'State Estimation' tab")
-        print("2. Select a grid (IEEE 9-Bus recommended)")
-        print("3. Click 'Simulate Outage' button")
-        print("4. Select at least one bus in the dialog")
-        print("5. Click 'Run Simulation'")
-        print("6. Check the main results area below the buttons")
-        print("7. Use 'View Results' for detailed analysis")
+        _p(f"\n🎉 ALL DEBUG TESTS PASSED!")
+        _p("✅ Outage simulation should work correctly")
+        _p("✅ GUI integration is functional")
+        
+        _p(f"\n🔧 IF YOU'RE STILL NOT SEEING RESULTS:")
+        _p("1. Make sure you're in the 'State Estimation' tab")
+        _p("2. Select a grid (IEEE 9-Bus recommended)")
+        _p("3. Click 'Simulate Outage' button")
+        _p("4. Select at least one bus in the dialog")
+        _p("5. Click 'Run Simulation'")
+        _p("6. Check the main results area below the buttons")
+        _p("7. Use 'View Results' for detailed analysis")
         
         # Offer to create test GUI
-        import sys
         if len(sys.argv) > 1 and sys.argv[1] == '--test-gui':
-            print(f"\n🧪 Creating minimal test GUI...")
+            _p(f"\n🧪 Creating minimal test GUI...")
             create_minimal_test_gui()
     else:
-        print(f"\n❌ DEBUG TESTS REVEALED ISSUES")
-        print("⚠️  Check the error messages above for specific problems")
\ No newline at end of file
+        _p(f"\n❌ DEBUG TESTS REVEALED ISSUES")
+        _p("⚠️  Check the error messages above for specific problems")
\ No newline at end of file
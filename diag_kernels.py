@@ -0,0 +1,44 @@
+"""Numba-compiled scan kernels shared by the diagnostic tools."""
+
+import os
+import numpy as np
+from numba import njit
+
+# Bit positions in the mask returned by scan_lines
+LINE_R_NONPOS = 1 << 0
+LINE_X_NONPOS = 1 << 1
+LINE_LENGTH_NONPOS = 1 << 2
+LINE_R_HIGH = 1 << 3
+LINE_X_HIGH = 1 << 4
+
+
+@njit(cache=True)
+def scan_lines(r, x, length):
+    """Scan line parameter columns and return a per-row fault bitmask.
+
+    One native pass over the three contiguous arrays replaces per-row
+    Python comparisons; rows with mask 0 are healthy and never reach the
+    Python-level message formatting. See the LINE_* constants for bits.
+    """
+    n = r.size
+    mask = np.zeros(n, np.uint8)
+    for i in range(n):
+        m = 0
+        if r[i] <= 0:
+            m |= 1
+        if x[i] <= 0:
+            m |= 2
+        if length[i] <= 0:
+            m |= 4
+        if r[i] > 10:
+            m |= 8
+        if x[i] > 10:
+            m |= 16
+        mask[i] = m
+    return mask
+
+
+# Warm up the JIT at import so the first real call hits the on-disk
+# compilation cache instead of paying cold-start compile latency
+if not os.environ.get("SKIP_WARMUP"):
+    scan_lines(np.array([1.0]), np.array([1.0]), np.array([1.0]))